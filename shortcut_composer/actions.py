@@ -7,12 +7,17 @@ Implementation of complex actions.
 NOTE: Make sure that every complex action implemented here has a
 definition in `shortcut_composer.action` file. Otherwise the action
 will not be visible in `keyboard shortcuts` menu in krita settings.
+
+Actions are wrapped in `LazyAction`, so that they are not created until
+their key is pressed. Only recently used actions get created earlier,
+when krita has nothing else to do.
 """
 
 import templates
 
 from PyQt5.QtGui import QColor
 
+from input_adapter import LazyAction
 from api_krita.enums import Action, Tool, Toggle, BlendingMode, TransformMode
 from core_components import instructions, controllers
 from data_components import (
@@ -27,9 +32,10 @@ from data_components import (
 INFINITY = float("inf")
 
 
-def create_actions() -> list[templates.RawInstructions]: return [
+def create_actions() -> list[LazyAction]: return [
     # Switch between FREEHAND BRUSH and the MOVE tool
-    templates.TemporaryKey(
+    LazyAction(
+        templates.TemporaryKey,
         name="Temporary move tool",
         controller=controllers.ToolController(),
         low_value=Tool.FREEHAND_BRUSH,
@@ -39,7 +45,8 @@ def create_actions() -> list[templates.RawInstructions]: return [
     # Switch the eraser toggle ON and OFF
     # Set tool to FREEHAND BRUSH if current tool does not allow to paint
     # Ensure the preserve alpha is OFF
-    templates.TemporaryKey(
+    LazyAction(
+        templates.TemporaryKey,
         name="Temporary eraser",
         controller=controllers.ToggleController(Toggle.ERASER),
         high_value=True,
@@ -52,7 +59,8 @@ def create_actions() -> list[templates.RawInstructions]: return [
     # Switch the preserve alpha toggle ON and OFF
     # Set tool to FREEHAND BRUSH if current tool does not allow to paint
     # Ensure the eraser toggle is OFF
-    templates.TemporaryKey(
+    LazyAction(
+        templates.TemporaryKey,
         name="Temporary preserve alpha",
         controller=controllers.ToggleController(Toggle.PRESERVE_ALPHA),
         high_value=True,
@@ -64,21 +72,24 @@ def create_actions() -> list[templates.RawInstructions]: return [
 
     # Run the ToggleLayerVisibility instruction
     # It toggles the current layer's visibility on key press and release
-    templates.RawInstructions(
+    LazyAction(
+        templates.RawInstructions,
         name="Preview current layer visibility",
         instructions=[instructions.ToggleLayerVisibility()],
     ),
 
     # Run the ToggleShowBelow instruction
     # It toggles the visibility of layers above
-    templates.RawInstructions(
+    LazyAction(
+        templates.RawInstructions,
         name="Preview projection below",
         instructions=[instructions.ToggleVisibilityAbove()],
     ),
 
     # Cycle between painting opacity values from values_to_cycle list
     # After a long key press, go back to opacity of 100%
-    templates.MultipleAssignment(
+    LazyAction(
+        templates.MultipleAssignment,
         name="Cycle painting opacity",
         controller=controllers.OpacityController(),
         instructions=[instructions.SetBrushOnNonPaintable()],
@@ -88,7 +99,8 @@ def create_actions() -> list[templates.RawInstructions]: return [
 
     # Cycle between selection tools from values_to_cycle list.
     # After a long key press, go back to the FREEHAND BRUSH tool
-    templates.MultipleAssignment(
+    LazyAction(
+        templates.MultipleAssignment,
         name="Cycle selection tools",
         controller=controllers.ToolController(),
         default_value=Tool.FREEHAND_BRUSH,
@@ -102,7 +114,8 @@ def create_actions() -> list[templates.RawInstructions]: return [
     # Control undo and redo actions by sliding the cursor horizontally
     # Start triggering the actions after passing a deadzone of 100 px
     # Use UndoOnPress instruction to trigger undo key press
-    templates.CursorTracker(
+    LazyAction(
+        templates.CursorTracker,
         name="Scroll undo stack",
         instructions=[instructions.UndoOnPress()],
         horizontal_slider=Slider(
@@ -114,7 +127,8 @@ def create_actions() -> list[templates.RawInstructions]: return [
 
     # Scroll all active layers by sliding the cursor vertically
     # Use TemporaryOn instruction to temporarily isolate active layer
-    templates.CursorTracker(
+    LazyAction(
+        templates.CursorTracker,
         name="Scroll isolated layers",
         instructions=[instructions.TemporaryOn(Toggle.ISOLATE_LAYER)],
         vertical_slider=Slider(
@@ -127,7 +141,8 @@ def create_actions() -> list[templates.RawInstructions]: return [
     # animated layers by sliding it vertically
     #
     # Use TemporaryOn instruction to temporarily isolate active layer
-    templates.CursorTracker(
+    LazyAction(
+        templates.CursorTracker,
         name="Scroll timeline or animated layers",
         instructions=[instructions.TemporaryOn(Toggle.ISOLATE_LAYER)],
         horizontal_slider=Slider(
@@ -145,7 +160,8 @@ def create_actions() -> list[templates.RawInstructions]: return [
     #
     # Opacity is contiguous from 10% to 100%, sizes come from a list
     # Switch 1% of opacity every 5 px (instead of default 50 px)
-    templates.CursorTracker(
+    LazyAction(
+        templates.CursorTracker,
         name="Scroll brush size or opacity",
         horizontal_slider=Slider(
             controller=controllers.BrushSizeController(),
@@ -166,7 +182,8 @@ def create_actions() -> list[templates.RawInstructions]: return [
 
     # Scroll canvas rotation sizes by sliding the cursor
     # horizontally or canvas zoom by sliding it vertically
-    templates.CursorTracker(
+    LazyAction(
+        templates.CursorTracker,
         name="Scroll canvas zoom or rotation",
         horizontal_slider=Slider(
             controller=controllers.CanvasRotationController(),
@@ -181,7 +198,8 @@ def create_actions() -> list[templates.RawInstructions]: return [
     ),
 
     # Use pie menu to pick one of the tools.
-    templates.PieMenu(
+    LazyAction(
+        templates.PieMenu,
         name="Pick misc tools",
         controller=controllers.ToolController(),
         values=[
@@ -196,7 +214,8 @@ def create_actions() -> list[templates.RawInstructions]: return [
 
 
     # Use pie menu to pick one of the actions
-    templates.PieMenu(
+    LazyAction(
+        templates.PieMenu,
         name="Activate krita action (red)",
         controller=controllers.ActionController(),
         values=[
@@ -211,7 +230,8 @@ def create_actions() -> list[templates.RawInstructions]: return [
     ),
 
     # Use pie menu to pick one of the actions
-    templates.PieMenu(
+    LazyAction(
+        templates.PieMenu,
         name="Activate krita action (green)",
         controller=controllers.ActionController(),
         values=[
@@ -226,7 +246,8 @@ def create_actions() -> list[templates.RawInstructions]: return [
     ),
 
     # Use pie menu to pick one of the actions
-    templates.PieMenu(
+    LazyAction(
+        templates.PieMenu,
         name="Activate krita action (blue)",
         controller=controllers.ActionController(),
         values=[
@@ -242,7 +263,8 @@ def create_actions() -> list[templates.RawInstructions]: return [
 
     # Use pie menu to pick one of the brush blending modes.
     # Set tool to FREEHAND BRUSH if current tool does not allow to paint
-    templates.PieMenu(
+    LazyAction(
+        templates.PieMenu,
         name="Pick painting blending modes",
         controller=controllers.BlendingModeController(),
         instructions=[instructions.SetBrushOnNonPaintable()],
@@ -260,7 +282,8 @@ def create_actions() -> list[templates.RawInstructions]: return [
     ),
 
     # Use pie menu to create painting layer with selected blending mode.
-    templates.PieMenu(
+    LazyAction(
+        templates.PieMenu,
         name="Create painting layer with blending mode",
         controller=controllers.CreateLayerWithBlendingController(),
         values=[
@@ -277,7 +300,8 @@ def create_actions() -> list[templates.RawInstructions]: return [
     ),
 
     # Pick one of the transform tool modes.
-    templates.PieMenu(
+    LazyAction(
+        templates.PieMenu,
         name="Pick transform tool modes",
         controller=controllers.TransformModeController(),
         deadzone_strategy=PieDeadzoneStrategy.PICK_TOP,
@@ -293,7 +317,8 @@ def create_actions() -> list[templates.RawInstructions]: return [
 
     # Use pie menu to pick one of stored presets.
     # Set tool to FREEHAND BRUSH if current tool does not allow to paint
-    templates.PieMenu(
+    LazyAction(
+        templates.PieMenu,
         name="Pick brush presets (red)",
         controller=controllers.PresetController(),
         instructions=[instructions.SetBrushOnNonPaintable()],
@@ -305,7 +330,8 @@ def create_actions() -> list[templates.RawInstructions]: return [
 
     # Use pie menu to pick one of stored presets.
     # Set tool to FREEHAND BRUSH if current tool does not allow to paint
-    templates.PieMenu(
+    LazyAction(
+        templates.PieMenu,
         name="Pick brush presets (green)",
         controller=controllers.PresetController(),
         instructions=[instructions.SetBrushOnNonPaintable()],
@@ -317,7 +343,8 @@ def create_actions() -> list[templates.RawInstructions]: return [
 
     # Use pie menu to pick one of stored presets.
     # Set tool to FREEHAND BRUSH if current tool does not allow to paint
-    templates.PieMenu(
+    LazyAction(
+        templates.PieMenu,
         name="Pick brush presets (blue)",
         controller=controllers.PresetController(),
         instructions=[instructions.SetBrushOnNonPaintable()],
@@ -330,7 +357,8 @@ def create_actions() -> list[templates.RawInstructions]: return [
     # Use pie menu to pick one of stored presets.
     # By default, preset names are stored in .kra document.
     # Set tool to FREEHAND BRUSH if current tool does not allow to paint
-    templates.PieMenu(
+    LazyAction(
+        templates.PieMenu,
         name="Pick local brush presets",
         controller=controllers.PresetController(),
         instructions=[instructions.SetBrushOnNonPaintable()],
@@ -341,7 +369,8 @@ def create_actions() -> list[templates.RawInstructions]: return [
     ),
 
     # Use rotation widget to rotate the canvas.
-    templates.RotationSelector(
+    LazyAction(
+        templates.RotationSelector,
         name="Rotate canvas",
         controller=controllers.CanvasRotationController(),
         is_widget_hidden=False,
@@ -353,7 +382,8 @@ def create_actions() -> list[templates.RawInstructions]: return [
     ),
 
     # Use rotation widget to rotate current brush preset.
-    templates.RotationSelector(
+    LazyAction(
+        templates.RotationSelector,
         name="Rotate brush",
         controller=controllers.BrushRotationController(),
         is_widget_hidden=False,
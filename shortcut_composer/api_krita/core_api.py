@@ -131,6 +131,13 @@ class KritaInstance:
                 self.main_window.themeChanged.connect(callback)
         QTimer.singleShot(1000, connect_callback)
 
+    def add_application_closing_callback(
+        self,
+        callback: Callable[[], None]
+    ) -> None:
+        """Add method which should be run when krita is being closed."""
+        self.instance.notifier().applicationClosing.connect(callback)
+
     def get_main_color_from_theme(self) -> QColor:
         """Return main color of the current theme."""
         return qApp.palette().color(QPalette.Window)
@@ -7,6 +7,9 @@ from .custom_widgets import AnimatedWidget, BaseWidget
 from .safe_confirm_button import SafeConfirmButton
 from .pixmap_transform import PixmapTransform
 from .round_button import RoundButton
+from .idle_queue import IdleQueue
+from .mouse_move_filter import MouseMoveFilter, MotionSample
+from .frame_clock import FrameClock, FramePhase
 from .painter import Painter
 from .timer import Timer
 
@@ -14,6 +17,11 @@ __all__ = [
     "SafeConfirmButton",
     "PixmapTransform",
     "AnimatedWidget",
+    "IdleQueue",
+    "MouseMoveFilter",
+    "MotionSample",
+    "FrameClock",
+    "FramePhase",
     "RoundButton",
     "BaseWidget",
     "Painter",
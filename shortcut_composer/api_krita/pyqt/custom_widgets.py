@@ -1,10 +1,12 @@
 # SPDX-FileCopyrightText: © 2022-2024 Wojciech Trybus <wojtryb@gmail.com>
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+from time import perf_counter
+
 from PyQt5.QtWidgets import QWidget
 from PyQt5.QtCore import QPoint
 
-from .timer import Timer
+from .frame_clock import FrameClock, FramePhase
 
 
 class BaseWidget(QWidget):
@@ -29,29 +31,30 @@ class BaseWidget(QWidget):
 
 
 class AnimatedWidget(QWidget):
-    """Adds the fade-in animation when the widget is shown (60 FPS)."""
+    """
+    Adds the fade-in animation when the widget is shown.
+
+    Opacity is based on time elapsed since showing the widget, so the
+    animation takes the same time regardless of the frame rate.
+    """
 
     def __init__(self, parent, animation_time: float = 0) -> None:
         super().__init__(parent)
         self._animation_time = animation_time
-        self._animation_interval = self._read_animation_interval()
-        self._animation_timer = Timer(self._increase_opacity, 17)
+        self._shown_at = 0.0
 
     def show(self) -> None:
-        """Decrease opacity to 0, and start a timer which animates it."""
-        self.setWindowOpacity(0)
-        self._animation_timer.start()
+        """Decrease opacity to 0, and start animating it on every frame."""
+        self._shown_at = perf_counter()
+        self.setWindowOpacity(0 if self._animation_time else 1)
+        if self._animation_time:
+            FrameClock.subscribe(self._increase_opacity, FramePhase.PAINT)
         super().show()
 
     def _increase_opacity(self) -> None:
-        """Add interval to current opacity, stop the timer when full."""
-        current_opacity = self.windowOpacity()
-        self.setWindowOpacity(current_opacity+self._animation_interval)
-        if current_opacity >= 1:
-            self._animation_timer.stop()
-
-    def _read_animation_interval(self) -> float:
-        """Return how much opacity (0-1) should be increased on each frame."""
-        if time := self._animation_time:
-            return 0.0167/time
-        return 1
+        """Set opacity based on elapsed time, stop animating when full."""
+        elapsed = perf_counter() - self._shown_at
+        opacity = min(elapsed / self._animation_time, 1)
+        self.setWindowOpacity(opacity)
+        if opacity >= 1:
+            FrameClock.unsubscribe(self._increase_opacity)
@@ -0,0 +1,84 @@
+# SPDX-FileCopyrightText: © 2022-2024 Wojciech Trybus <wojtryb@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from enum import Enum
+from typing import Callable
+
+from PyQt5.QtCore import QTimer
+
+EmptyCallback = Callable[[], None]
+
+
+class FramePhase(Enum):
+    """
+    Part of the frame in which the subscriber is called.
+
+    Phases are performed in order of definition.
+    """
+
+    INPUT = 0
+    """Reading the mouse and other input devices."""
+    UPDATE = 1
+    """Updating state and animations based on the input."""
+    ACTUATE = 2
+    """Setting values in krita based on the updated state."""
+    PAINT = 3
+    """Repainting widgets to represent the updated state."""
+
+
+class GlobalFrameClock:
+    """
+    Single timer which wakes all the animated objects in the plugin.
+
+    Objects subscribe a callback for one of the frame phases. On each
+    frame, phases are performed in order, and callbacks within a phase
+    are called in order of subscribing.
+
+    Timer runs only when there is at least one subscriber.
+    """
+
+    def __init__(self, interval_ms: int = 17) -> None:
+        self._timer = QTimer()
+        self._timer.timeout.connect(self._tick)
+        self._interval_ms = interval_ms
+        self._subscribers: dict[FramePhase, list[EmptyCallback]] = {
+            phase: [] for phase in FramePhase}
+
+    def set_interval(self, interval_ms: int) -> None:
+        """Change time between frames. Applies to the running timer."""
+        self._interval_ms = interval_ms
+        if self._timer.isActive():
+            self._timer.start(interval_ms)
+
+    def subscribe(self, callback: EmptyCallback, phase: FramePhase) -> None:
+        """Call the callback in given phase of every frame until removed."""
+        subscribers = self._subscribers[phase]
+        if callback in subscribers:
+            return
+        subscribers.append(callback)
+        if not self._timer.isActive():
+            self._timer.start(self._interval_ms)
+
+    def unsubscribe(self, callback: EmptyCallback) -> None:
+        """Stop calling the callback. Stop the timer when nothing is left."""
+        for subscribers in self._subscribers.values():
+            if callback in subscribers:
+                subscribers.remove(callback)
+        if not self.is_active:
+            self._timer.stop()
+
+    @property
+    def is_active(self) -> bool:
+        """Return whether any callback is subscribed."""
+        return any(self._subscribers.values())
+
+    def _tick(self) -> None:
+        """Call subscribers of all phases. Skip ones removed meanwhile."""
+        for subscribers in self._subscribers.values():
+            for callback in list(subscribers):
+                if callback in subscribers:
+                    callback()
+
+
+FrameClock = GlobalFrameClock()
+"""Timer shared by all the animated objects of the plugin."""
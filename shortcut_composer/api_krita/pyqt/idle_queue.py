@@ -0,0 +1,58 @@
+# SPDX-FileCopyrightText: © 2022-2024 Wojciech Trybus <wojtryb@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import traceback
+from time import perf_counter
+from collections import deque
+from typing import Any, Iterable, Iterator
+
+from PyQt5.QtCore import QTimer
+
+
+class IdleQueue:
+    """
+    Performs queued tasks in small steps, when Qt has nothing to do.
+
+    Task is an iterable, which performs a step of work each time its
+    next element is requested. Tasks are processed in order they were
+    added, in slices run by a timer with no delay. Each slice performs
+    steps until its time budget is used, so that ui stays responsive.
+
+    Step which raises an exception drops its task, and the error is
+    printed. Other tasks are performed normally.
+    """
+
+    def __init__(self, slice_budget_ms: float = 5) -> None:
+        self._slice_budget = slice_budget_ms / 1000
+        self._tasks: deque[Iterator[Any]] = deque()
+        self._is_scheduled = False
+
+    def add(self, task: Iterable[Any]) -> None:
+        """Add task at the end of the queue and make sure it will run."""
+        self._tasks.append(iter(task))
+        self._schedule()
+
+    def clear(self) -> None:
+        """Drop all tasks which were not finished yet."""
+        self._tasks.clear()
+
+    def _schedule(self) -> None:
+        """Request running the next slice when Qt becomes idle."""
+        if not self._is_scheduled and self._tasks:
+            self._is_scheduled = True
+            QTimer.singleShot(0, self._run_slice)
+
+    def _run_slice(self) -> None:
+        """Perform steps of tasks until time budget of a slice is used."""
+        self._is_scheduled = False
+        deadline = perf_counter() + self._slice_budget
+        while self._tasks and perf_counter() < deadline:
+            task = self._tasks[0]
+            try:
+                next(task)
+            except StopIteration:
+                self._tasks.popleft()
+            except Exception:
+                self._tasks.popleft()
+                traceback.print_exc()
+        self._schedule()
@@ -0,0 +1,120 @@
+# SPDX-FileCopyrightText: © 2022-2024 Wojciech Trybus <wojtryb@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from time import perf_counter
+from typing import Callable, Literal, NamedTuple
+
+from PyQt5.QtCore import QObject, QEvent, QPoint
+from PyQt5.QtGui import QCursor
+from PyQt5.QtWidgets import QApplication, QWidget
+
+from .frame_clock import FrameClock, FramePhase
+from .timer import Timer
+
+
+class MotionSample(NamedTuple):
+    """Global cursor position with time [s] of reading it."""
+
+    x: int
+    y: int
+    time: float
+
+    def to_point(self) -> QPoint:
+        """Return position of the sample as QPoint."""
+        return QPoint(self.x, self.y)
+
+
+MoveCallback = Callable[[MotionSample], None]
+
+
+class MouseMoveFilter(QObject):
+    """
+    Reports the cursor position once per frame in which the mouse moved.
+
+    Between start() and stop() calls, passed callback is run with a
+    sample of global cursor position. First sample is reported right
+    away on start. Later ones are reported in the input phase of the
+    `FrameClock`, when the cursor position differs from the last one.
+
+    Application motion events subscribe to the next frame, in which the
+    cursor is read once, so all the motion of a frame is compressed into
+    one sample. Nothing runs while the cursor does not move.
+
+    Application gets no events when the cursor is outside of krita
+    windows. After the cursor leaves them, it is polled every
+    `POLL_INTERVAL_MS` until motion events arrive again.
+    """
+
+    MOTION_EVENTS = {
+        QEvent.MouseMove,
+        QEvent.TabletMove,
+        QEvent.HoverMove,
+        QEvent.DragMove}
+    """Event types which are considered as cursor motion."""
+
+    POLL_INTERVAL_MS = 50
+    """Time between cursor reads, when it is outside of krita windows."""
+
+    def __init__(self, callback: MoveCallback) -> None:
+        super().__init__(None)
+        self._callback = callback
+        self._is_active = False
+        self._last_sample = MotionSample(0, 0, 0.0)
+        self._poll_timer = Timer(self._report_if_moved, self.POLL_INTERVAL_MS)
+
+    def start(self) -> None:
+        """Start reporting the motion of cursor. Report current position."""
+        if self._is_active:
+            return
+        self._is_active = True
+        QApplication.instance().installEventFilter(self)
+        self._last_sample = self._read_cursor()
+        if QApplication.widgetAt(self._last_sample.to_point()) is None:
+            self._poll_timer.start()
+        self._callback(self._last_sample)
+
+    def stop(self) -> None:
+        """Stop reporting the motion of cursor."""
+        if self._is_active:
+            self._is_active = False
+            QApplication.instance().removeEventFilter(self)
+            FrameClock.unsubscribe(self._on_frame)
+            self._poll_timer.stop()
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> Literal[False]:
+        """
+        Override filtering method, executed by Qt on every event.
+
+        Motion requests reading the cursor in the next frame. Leaving a
+        krita window, or the application losing focus, starts polling
+        the cursor. Always return False to let the event reach its
+        desired destination.
+        """
+        event_type = event.type()
+        if event_type in self.MOTION_EVENTS:
+            self._poll_timer.stop()
+            FrameClock.subscribe(self._on_frame, FramePhase.INPUT)
+        elif (event_type == QEvent.ApplicationDeactivate
+              or event_type == QEvent.Leave
+              and isinstance(watched, QWidget)
+              and watched.isWindow()):
+            self._poll_timer.start()
+        return False
+
+    def _on_frame(self) -> None:
+        """Report the cursor position once, after it moved."""
+        FrameClock.unsubscribe(self._on_frame)
+        self._report_if_moved()
+
+    def _report_if_moved(self) -> None:
+        """Read the cursor, and report it if it moved since last sample."""
+        sample = self._read_cursor()
+        moved = sample[:2] != self._last_sample[:2]
+        self._last_sample = sample
+        if moved:
+            self._callback(sample)
+    @staticmethod
+    def _read_cursor() -> MotionSample:
+        """Return sample of current global cursor position."""
+        pos = QCursor.pos()
+        return MotionSample(pos.x(), pos.y(), perf_counter())
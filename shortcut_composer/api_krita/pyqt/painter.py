@@ -3,9 +3,14 @@
 
 import math
 
-from PyQt5.QtGui import QPainter, QPainterPath, QColor, QPixmap, QPaintEvent
+from PyQt5.QtGui import (
+    QPaintDevice,
+    QPainterPath,
+    QPaintEvent,
+    QPainter,
+    QPixmap,
+    QColor)
 from PyQt5.QtCore import QPoint, QRectF
-from PyQt5.QtWidgets import QWidget
 
 
 class Painter:
@@ -16,15 +21,29 @@ class Painter:
     - wheel of given thickness, color and radius
     - pie being a part of a wheel
     - pixmap providing a center instead of top-left corner
+    - path prepared earlier with `pie_path()`
+
+    Paints on a widget during its paint event, or on any other paint
+    device (like pixmap) when the event is not given.
 
     Unlike original painter, can be used with context manager.
     """
 
-    def __init__(self, widget: QWidget, event: QPaintEvent) -> None:
-        self._painter = QPainter(widget)
-        self._painter.eraseRect(event.rect())
+    def __init__(
+        self,
+        device: QPaintDevice,
+        event: QPaintEvent | None = None
+    ) -> None:
+        self._painter = QPainter(device)
+        if event is not None:
+            self._painter.eraseRect(event.rect())
         self._painter.setRenderHints(QPainter.Antialiasing)
 
+    @property
+    def device_pixel_ratio(self) -> float:
+        """Return ratio between physical and logical pixels of device."""
+        return self._painter.device().devicePixelRatioF()
+
     def paint_wheel(
         self,
         center: QPoint,
@@ -54,29 +73,55 @@ class Painter:
         thickness: float | None = None,
     ) -> None:
         """Paint part of wheel a, that spans left and right by span/2."""
+        path = self.pie_path(center, outer_radius, angle, span, thickness)
+        self._painter.fillPath(path, color)
+
+    def paint_path(self, path: QPainterPath, color: QColor) -> None:
+        """Fill the path with color."""
+        self._painter.fillPath(path, color)
+
+    @classmethod
+    def pie_path(
+        cls,
+        center: QPoint,
+        outer_radius: int,
+        angle: int,
+        span: int,
+        thickness: float | None = None,
+    ) -> QPainterPath:
+        """Return path of the pie, which can be painted multiple times."""
         angle = -angle + 90
         path = QPainterPath()
         path.moveTo(center)
-        outer_rectangle = self._square(center, outer_radius*2)
+        outer_rectangle = cls._square(center, outer_radius*2)
         path.arcTo(outer_rectangle, angle-math.floor(span/2), span)
 
         if thickness:
             inner_radius = outer_radius-thickness
-            inner_rectangle = self._square(center, round(inner_radius*2))
+            inner_rectangle = cls._square(center, round(inner_radius*2))
             path.arcTo(inner_rectangle, angle+math.ceil(span/2), -span)
 
-        self._painter.fillPath(path, color)
+        return path
 
     def paint_pixmap(self, center: QPoint, pixmap: QPixmap) -> None:
-        """Paint pixmap providing a center instead of top-left corner."""
+        """
+        Paint pixmap providing a center instead of top-left corner.
+
+        Pixmap is painted in its logical size, which for high dpi
+        pixmaps is smaller than its size in pixels.
+        """
+        ratio = pixmap.devicePixelRatioF()
+        width = round(pixmap.width()/ratio)
+        height = round(pixmap.height()/ratio)
         self._painter.drawPixmap(
-            center.x() - pixmap.width()//2,
-            center.y() - pixmap.height()//2,
-            pixmap.width(),
-            pixmap.height(),
+            center.x() - width//2,
+            center.y() - height//2,
+            width,
+            height,
             pixmap)
 
-    def _square(self, center: QPoint, width: int) -> QRectF:
+    @staticmethod
+    def _square(center: QPoint, width: int) -> QRectF:
         """Return a square of given `width` at `center` point."""
         return QRectF(center.x()-width//2, center.y()-width//2, width, width)
 
@@ -3,14 +3,19 @@
 
 """Utilities specific for this plugin. Not directly reusable elsewhere."""
 
-from .animation_progress import AnimationProgress
+from .animation_progress import (
+    AnimationProgressArray,
+    AnimationProgress,
+    AnimationClock)
 from .settings_dialog import SettingsDialog
 from .buttons_layout import ButtonsLayout
 from .circle_points import CirclePoints
 from .global_config import Config
 
 __all__ = [
+    "AnimationProgressArray",
     "AnimationProgress",
+    "AnimationClock",
     "SettingsDialog",
     "ButtonsLayout",
     "CirclePoints",
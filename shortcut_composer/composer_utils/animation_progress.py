@@ -1,7 +1,10 @@
 # SPDX-FileCopyrightText: © 2022-2024 Wojciech Trybus <wojtryb@gmail.com>
 # SPDX-License-Identifier: GPL-3.0-or-later
 
-from .global_config import Config
+from array import array
+from math import exp
+from time import perf_counter
+from typing import Iterator
 
 
 class AnimationProgress:
@@ -11,27 +14,30 @@ class AnimationProgress:
     Holds the state of animation as float in range <0-1> which can be
     obtained with `value` property.
 
-    Animation state can be altered with `up()` and `down()` methods.
-    The change is the fastest when the animation starts, and then slows
-    down near the end (controlled by `steep` argument).
+    Animation state can be altered with `up()` and `down()` methods,
+    which take time in seconds elapsed since the previous change. The
+    change is the fastest when the animation starts, and then slows
+    down near the end (controlled by `steep` argument). Progress is
+    the same for any split of time into steps, so the animation does
+    not depend on the frame rate.
 
     There is a `reset()` method to cancel the animation immediately.
     """
 
     def __init__(self, speed_scale: float = 1.0, steep: float = 1.0) -> None:
-        self._value = 0
-        self._speed = 0.004*Config.get_sleep_time()*speed_scale
+        self._value = 0.0
+        self._rate = 4*speed_scale
         self._steep = steep
 
-    def up(self) -> None:
-        """Increase the animation progress."""
-        difference = (1+self._steep-self._value) * self._speed
-        self._value = min(self._value + difference, 1)
+    def up(self, elapsed: float) -> None:
+        """Increase the animation progress by elapsed seconds."""
+        decay = exp(-self._rate*elapsed)
+        self._value = _raised(self._value, self._steep, decay)
 
-    def down(self) -> None:
-        """Decrease the animation progress."""
-        difference = (self._value+self._steep) * self._speed
-        self._value = max(self._value - difference, 0)
+    def down(self, elapsed: float) -> None:
+        """Decrease the animation progress by elapsed seconds."""
+        decay = exp(-self._rate*elapsed)
+        self._value = _lowered(self._value, self._steep, decay)
 
     @property
     def value(self) -> float:
@@ -41,3 +47,94 @@ class AnimationProgress:
     def reset(self) -> None:
         """Arbitrarily set a value to 0"""
         self._value = 0
+
+
+class AnimationProgressArray:
+    """
+    Progress of a fixed amount of animations, indexed by integers.
+
+    Animations behave like `AnimationProgress`, but their values are
+    stored in a compact array. At most one animation is raised at a
+    time, and the rest are lowered. Only the animations which are still
+    running are touched on `tick()`.
+    """
+
+    def __init__(
+        self,
+        size: int,
+        speed_scale: float = 1.0,
+        steep: float = 1.0,
+    ) -> None:
+        self._values = array("d", bytes(8*size))
+        self._running: set[int] = set()
+        self._rate = 4*speed_scale
+        self._steep = steep
+
+    def __len__(self) -> int:
+        """Return amount of animations in the array."""
+        return len(self._values)
+
+    def __getitem__(self, index: int) -> float:
+        """Get state of animation of given index. It is in range <0-1>."""
+        return self._values[index]
+
+    def tick(self, raised: int | None, elapsed: float) -> None:
+        """Raise animation of given index, and lower all the others."""
+        decay = exp(-self._rate*elapsed)
+        if raised is not None:
+            self._values[raised] = _raised(
+                self._values[raised], self._steep, decay)
+            self._running.add(raised)
+
+        for index in list(self._running):
+            if index == raised:
+                continue
+            value = _lowered(self._values[index], self._steep, decay)
+            self._values[index] = value
+            if not value:
+                self._running.remove(index)
+
+    def running(self) -> Iterator[tuple[int, float]]:
+        """Iterate over indices and values of not finished animations."""
+        for index in self._running:
+            yield index, self._values[index]
+
+    def reset(self) -> None:
+        """Arbitrarily set all the values to 0."""
+        for index in self._running:
+            self._values[index] = 0
+        self._running.clear()
+
+
+def _raised(value: float, steep: float, decay: float) -> float:
+    """Return value raised with the easing, given its time decay."""
+    target = 1 + steep
+    return min(target - (target-value)*decay, 1)
+
+
+def _lowered(value: float, steep: float, decay: float) -> float:
+    """Return value lowered with the easing, given its time decay."""
+    return max((value+steep)*decay - steep, 0)
+
+
+class AnimationClock:
+    """
+    Measures time elapsed between frames of a group of animations.
+
+    Clock is shared by all animations of the group, so the time is
+    measured once per frame, not once per animation.
+    """
+
+    def __init__(self) -> None:
+        self._last_tick = perf_counter()
+
+    def restart(self) -> None:
+        """Start measuring time from now."""
+        self._last_tick = perf_counter()
+
+    def tick(self) -> float:
+        """Return seconds elapsed since last tick or restart."""
+        now = perf_counter()
+        elapsed = now - self._last_tick
+        self._last_tick = now
+        return elapsed
@@ -43,9 +43,15 @@ class GlobalConfig(FieldGroup):
         self.PIE_DEADZONE_GLOBAL_SCALE = self.field(
             name="Pie deadzone global scale",
             default=1.0)
+        self.PIE_PAGE_SIZE = self.field(
+            name="Pie page size",
+            default=0)
         self.PIE_ANIMATION_TIME = self.field(
             name="Pie animation time",
             default=0.2)
+        self.LABEL_PIXMAP_CACHE_SIZE = self.field(
+            name="Label pixmap cache size",
+            default=32)
 
         self.OVERRIDE_BACKGROUND_THEME_COLOR = self.field(
             name="Override background theme color",
@@ -65,11 +71,53 @@ class GlobalConfig(FieldGroup):
             name="Global pie opacity",
             default=75)
 
+        self.RECENTLY_USED_ACTIONS = self.field(
+            name="Recently used actions",
+            default=[],
+            parser_type=str)
+        self._recent_actions: list[str] | None = None
+        self.RECENTLY_USED_ACTIONS.register_callback(
+            self._forget_used_actions)
+
     def get_sleep_time(self) -> int:
         """Read sleep time from FPS_LIMIT config field."""
         fps_limit = self.FPS_LIMIT.read()
         return round(1000/fps_limit) if fps_limit else 1
 
+    def get_pie_page_size(self) -> int | None:
+        """Read maximal amount of labels in a pie page. None if no paging."""
+        page_size = self.PIE_PAGE_SIZE.read()
+        return page_size if page_size > 0 else None
+
+    def remember_used_action(self, name: str, limit: int = 5) -> None:
+        """
+        Move action name to the front of recently used actions.
+
+        Change is only kept in memory, as it happens on every key press.
+        It gets saved to config with `save_used_actions()`.
+        """
+        recent = self.get_used_actions()
+        if recent[:1] == [name]:
+            return
+        if name in recent:
+            recent.remove(name)
+        self._recent_actions = [name, *recent][:limit]
+
+    def get_used_actions(self) -> list[str]:
+        """Return names of recently used actions, starting from latest."""
+        if self._recent_actions is None:
+            self._recent_actions = self.RECENTLY_USED_ACTIONS.read()
+        return list(self._recent_actions)
+
+    def save_used_actions(self) -> None:
+        """Write recently used actions remembered in memory to config."""
+        if self._recent_actions is not None:
+            self.RECENTLY_USED_ACTIONS.write(self._recent_actions)
+
+    def _forget_used_actions(self) -> None:
+        """Read recently used actions again, as they changed in config."""
+        self._recent_actions = None
+
     @property
     def default_background_color(self) -> QColor:
         """Color of pies, when the pie does not specify a custom one."""
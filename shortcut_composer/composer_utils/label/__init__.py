@@ -6,10 +6,12 @@ from .label_widget import LabelWidget
 from .label_interface import LabelInterface
 from .label_widget_style import LabelWidgetStyle
 from .label_text_colorizer import LabelTextColorizer
+from .label_pixmap_cache import PixmapCache
 
 __all__ = [
     "LabelText",
     "LabelWidget",
     "LabelInterface",
     "LabelWidgetStyle",
-    "LabelTextColorizer"]
+    "LabelTextColorizer",
+    "PixmapCache"]
@@ -0,0 +1,68 @@
+# SPDX-FileCopyrightText: © 2022-2024 Wojciech Trybus <wojtryb@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from collections import OrderedDict
+from typing import Callable, Hashable
+
+from PyQt5.QtGui import QPixmap
+
+from ..global_config import Config
+
+
+class LabelPixmapCache:
+    """
+    Process-wide storage of pixmaps prepared for displaying labels.
+
+    Pixmaps are shared between all the label widgets, in all the pies
+    and settings. They are stored under keys describing all the values
+    that affect them: shape, displayed value, size and pixel ratio.
+
+    When the size of stored pixmaps exceeds the budget, the least
+    recently used ones are dropped. Pixmaps of keys which can't be
+    hashed are created each time, and not stored.
+    """
+
+    def __init__(self, budget_mb_callback: Callable[[], int]) -> None:
+        self._budget_mb_callback = budget_mb_callback
+        self._pixmaps: OrderedDict[Hashable, QPixmap] = OrderedDict()
+        self._size_bytes = 0
+
+    def get(self, key: Hashable, create: Callable[[], QPixmap]) -> QPixmap:
+        """Return pixmap stored under the key, creating it if needed."""
+        try:
+            pixmap = self._pixmaps[key]
+        except KeyError:
+            pass
+        except TypeError:
+            return create()
+        else:
+            self._pixmaps.move_to_end(key)
+            return pixmap
+
+        pixmap = create()
+        self._pixmaps[key] = pixmap
+        self._size_bytes += self._cost(pixmap)
+        self._drop_over_budget()
+        return pixmap
+
+    def clear(self) -> None:
+        """Drop all stored pixmaps."""
+        self._pixmaps.clear()
+        self._size_bytes = 0
+
+    def _drop_over_budget(self) -> None:
+        """Drop least recently used pixmaps until they fit the budget."""
+        budget = self._budget_mb_callback() * 1024 * 1024
+        while self._size_bytes > budget and self._pixmaps:
+            _, pixmap = self._pixmaps.popitem(last=False)
+            self._size_bytes -= self._cost(pixmap)
+
+    @staticmethod
+    def _cost(pixmap: QPixmap) -> int:
+        """Return approximate amount of memory taken by pixmap."""
+        return pixmap.width() * pixmap.height() * pixmap.depth() // 8
+
+
+PixmapCache = LabelPixmapCache(
+    budget_mb_callback=Config.LABEL_PIXMAP_CACHE_SIZE.read)
+"""Pixmaps of labels, shared between all the label widgets."""
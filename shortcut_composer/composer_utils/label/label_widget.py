@@ -49,6 +49,15 @@ class LabelWidget(BaseWidget, Generic[T]):
 
         self._instructions: list[WidgetInstructions] = []
 
+    def set_label(self, label: T) -> None:
+        """Display a different label, preparing its content again."""
+        self.label = label
+        self._prepare_content()
+        self.update()
+
+    def _prepare_content(self) -> None:
+        """Prepare what is displayed, based on the label and the style."""
+
     def add_instruction(self, instruction: WidgetInstructions):
         """Add additional logic to do on entering and leaving widget."""
         self._instructions.append(instruction)
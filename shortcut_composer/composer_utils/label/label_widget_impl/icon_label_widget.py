@@ -4,6 +4,7 @@
 from PyQt5.QtGui import QPixmap, QIcon
 
 from api_krita.pyqt import PixmapTransform
+from ..label_pixmap_cache import PixmapCache
 from .image_label_widget import ImageLabelWidget
 
 
@@ -18,6 +19,15 @@ class IconLabelWidget(ImageLabelWidget):
             raise TypeError("Label supposed to be QIcon.")
 
         size = round(self.icon_radius*1.1)
-        return PixmapTransform.scale_pixmap(
-            pixmap=to_display.pixmap(size, size),
-            size_px=size)
+        ratio = self.devicePixelRatioF()
+
+        def create() -> QPixmap:
+            pixmap = PixmapTransform.scale_pixmap(
+                pixmap=to_display.pixmap(size, size),
+                size_px=round(size*ratio))
+            pixmap.setDevicePixelRatio(ratio)
+            return pixmap
+
+        # Cache key of the icon changes when the icon gets modified
+        key = ("icon", to_display.cacheKey(), size, ratio)
+        return PixmapCache.get(key, create)
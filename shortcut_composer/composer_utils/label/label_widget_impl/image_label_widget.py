@@ -7,6 +7,7 @@ from PyQt5.QtGui import QPixmap
 from PyQt5.QtWidgets import QWidget
 
 from api_krita.pyqt import Painter, PixmapTransform
+from ..label_pixmap_cache import PixmapCache
 from ..label_widget_style import LabelWidgetStyle
 from ..label_widget import LabelWidget
 from ..label_interface import LabelInterface
@@ -24,6 +25,10 @@ class ImageLabelWidget(LabelWidget[T]):
         parent: QWidget,
     ) -> None:
         super().__init__(label, label_widget_style, parent)
+        self._prepare_content()
+
+    def _prepare_content(self) -> None:
+        """Prepare the image to display."""
         self.ready_image = self._prepare_image()
 
     def paint(self, painter: Painter) -> None:
@@ -37,10 +42,20 @@ class ImageLabelWidget(LabelWidget[T]):
         if not isinstance(to_display, QPixmap):
             raise TypeError("Label supposed to be QPixmap.")
 
-        rounded_image = PixmapTransform.make_pixmap_round(to_display)
-        return PixmapTransform.scale_pixmap(
-            pixmap=rounded_image,
-            size_px=round((
-                self.icon_radius
-                - self._label_widget_style.border_thickness
-                - self._active_indicator_thickness)*2))
+        size = round((
+            self.icon_radius
+            - self._label_widget_style.border_thickness
+            - self._active_indicator_thickness)*2)
+        ratio = self.devicePixelRatioF()
+
+        def create() -> QPixmap:
+            rounded_image = PixmapTransform.make_pixmap_round(to_display)
+            pixmap = PixmapTransform.scale_pixmap(
+                pixmap=rounded_image,
+                size_px=round(size*ratio))
+            pixmap.setDevicePixelRatio(ratio)
+            return pixmap
+
+        # Cache key of the image changes when the image gets modified
+        key = ("round image", to_display.cacheKey(), size, ratio)
+        return PixmapCache.get(key, create)
@@ -4,13 +4,15 @@
 from typing import TypeVar
 
 from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QFont, QColor, QFontDatabase
-from PyQt5.QtWidgets import QLabel, QWidget
+from PyQt5.QtGui import QFont, QPainter, QPixmap, QFontDatabase
+from PyQt5.QtWidgets import QWidget
 
 from api_krita import Krita
+from api_krita.pyqt import Painter
 from ..label_text import LabelText
 from ..label_widget import LabelWidget
 from ..label_interface import LabelInterface
+from ..label_pixmap_cache import PixmapCache
 from ..label_widget_style import LabelWidgetStyle
 
 T = TypeVar("T", bound=LabelInterface)
@@ -26,32 +28,44 @@ class TextLabelWidget(LabelWidget[T]):
         parent: QWidget,
     ) -> None:
         super().__init__(label, label_widget_style, parent)
-        self._pyqt_label = self._create_pyqt_label()
+        self._prepare_content()
 
-    def _create_pyqt_label(self) -> QLabel:
-        """Create and show a new Qt5 label. Does not need redrawing."""
+    def _prepare_content(self) -> None:
+        """Prepare the text to display."""
+        self.ready_text = self._prepare_text()
+
+    def paint(self, painter: Painter) -> None:
+        super().paint(painter)
+        painter.paint_pixmap(self.center, self.ready_text)
+
+    def _prepare_text(self) -> QPixmap:
+        """Return pixmap with text rendered on the theme background."""
         to_display = self.label.display_value
 
         if not isinstance(to_display, LabelText):
             raise TypeError("Label supposed to be text.")
 
         height = round(self.icon_radius*0.75)
-
-        label = QLabel(self)
-        label.setText(to_display.value)
-        label.setAlignment(Qt.AlignCenter)
-        label.resize(round(height*2), round(height))
-        label.setFont(self._font)
-        label.move(self.center.x()-height,
-                   self.center.y()-height//2)
-        label.setStyleSheet(f'''
-            background-color:rgba({self._color_to_str(
-            Krita.get_main_color_from_theme())});
-            color:rgba({self._color_to_str(to_display.color)});
-        ''')
-
-        label.show()
-        return label
+        background = Krita.get_main_color_from_theme()
+        font = self._font
+        ratio = self.devicePixelRatioF()
+
+        def create() -> QPixmap:
+            pixmap = QPixmap(round(height*2*ratio), round(height*ratio))
+            pixmap.setDevicePixelRatio(ratio)
+            pixmap.fill(background)
+            painter = QPainter(pixmap)
+            painter.setRenderHints(QPainter.TextAntialiasing)
+            painter.setFont(font)
+            painter.setPen(to_display.color)
+            painter.drawText(0, 0, height*2, height,
+                             Qt.AlignCenter, to_display.value)
+            painter.end()
+            return pixmap
+
+        key = ("text", to_display.value, to_display.color.rgba(),
+               background.rgba(), font.key(), height, ratio)
+        return PixmapCache.get(key, create)
 
     @property
     def _font(self) -> QFont:
@@ -76,7 +90,3 @@ class TextLabelWidget(LabelWidget[T]):
         if signs_amount <= 4:
             return 1
         return 4/(signs_amount)
-
-    @staticmethod
-    def _color_to_str(color: QColor) -> str: return f'''
-        {color.red()}, {color.green()}, {color.blue()}, {color.alpha()}'''
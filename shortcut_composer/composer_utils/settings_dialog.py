@@ -1,13 +1,19 @@
 # SPDX-FileCopyrightText: © 2022-2024 Wojciech Trybus <wojtryb@gmail.com>
 # SPDX-License-Identifier: GPL-3.0-or-later
 
-from PyQt5.QtWidgets import QVBoxLayout, QDialog
+from PyQt5.QtWidgets import (
+    QVBoxLayout,
+    QDialog,
+    QFileDialog,
+    QMessageBox,
+    QPushButton)
 from PyQt5.QtCore import Qt, QSize
 from PyQt5.QtGui import QCursor
 
 from api_krita import Krita
 from INFO import __version__, __author__, __license__
 from config_system.ui import ConfigFormWidget, SpinBox, ColorButton, Checkbox
+from input_adapter import Latency
 from .global_config import Config
 from .buttons_layout import ButtonsLayout
 
@@ -83,6 +89,16 @@ class SettingsDialog(QDialog):
                 step=0.05,
                 max_value=4,
                 tooltip="Scale of deadzone of all the pie menus."),
+            SpinBox(
+                config_field=Config.PIE_PAGE_SIZE,
+                parent=self,
+                pretty_name="Pie page size",
+                step=1,
+                max_value=200,
+                tooltip=""
+                "Maximal amount of icons displayed at once in a pie.\n"
+                "Pies with more values are split into pages, which can\n"
+                "be switched with a mouse wheel. 0 turns off paging."),
 
             "Pie menu style",
             bg_checkbox := Checkbox(
@@ -119,6 +135,15 @@ class SettingsDialog(QDialog):
                 step=0.01,
                 max_value=1,
                 tooltip="Time of the pie opening animation."),
+            SpinBox(
+                config_field=Config.LABEL_PIXMAP_CACHE_SIZE,
+                parent=self,
+                pretty_name="Label image cache size [MB]",
+                step=8,
+                max_value=1024,
+                tooltip=""
+                "Memory for icons prepared for displaying in pies.\n"
+                "Icons are prepared again when they do not fit in it."),
 
             f"Shortcut Composer v{__version__}\n"
             f"Maintainer: {__author__}\n"
@@ -133,8 +158,14 @@ class SettingsDialog(QDialog):
         active_checkbox.widget.stateChanged.connect(update_theme_state)
         update_theme_state()
 
+        latency_button = QPushButton("Show latency report")
+        latency_button.setToolTip(
+            "Time from pressing a key to painting the pie or selector.")
+        latency_button.clicked.connect(self._show_latency_report)
+
         full_layout = QVBoxLayout(self)
         full_layout.addWidget(self._general_tab)
+        full_layout.addWidget(latency_button)
         full_layout.addLayout(ButtonsLayout(
             ok_callback=self.ok,
             apply_callback=self.apply,
@@ -167,3 +198,20 @@ class SettingsDialog(QDialog):
 
     def refresh(self) -> None:
         self._general_tab.refresh()
+
+    def _show_latency_report(self) -> None:
+        """Show measured latency of actions, allowing to save it."""
+        message = QMessageBox(self)
+        message.setWindowTitle("Latency report")
+        message.setText(Latency.report())
+        message.setStyleSheet("QLabel { font-family: monospace; }")
+        save_button = message.addButton("Save...", QMessageBox.ActionRole)
+        message.addButton(QMessageBox.Close)
+        message.exec_()
+
+        if message.clickedButton() != save_button:
+            return
+        path, _ = QFileDialog.getSaveFileName(
+            self, "Save latency report", "latency.txt", "Text (*.txt)")
+        if path:
+            Latency.dump(path)
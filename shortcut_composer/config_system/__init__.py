@@ -7,11 +7,15 @@ System granting easier API to control krita configuration in kritarc.
 Consists of two classes: "Field" and "FieldGroup".
 Read the documentation of those classes for more info.
 
+Parsed values are shared between fields in "FieldCache", which needs
+to be cleared when the configuration changes outside of the plugin.
+
 Holds a subpackage with ui elements dependent on the introduced
 configuration concept.
 """
 
 from .field import Field
 from .field_group import FieldGroup
+from .common_utils import FieldCache
 
-__all__ = ["Field", "FieldGroup"]
+__all__ = ["Field", "FieldGroup", "FieldCache"]
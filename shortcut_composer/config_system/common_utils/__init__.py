@@ -5,5 +5,7 @@
 
 from .api_krita import Krita
 from .save_location import SaveLocation
+from .field_cache import FieldCache
+from .write_transaction import Transaction
 
-__all__ = ["Krita", "SaveLocation"]
+__all__ = ["Krita", "SaveLocation", "FieldCache", "Transaction"]
@@ -0,0 +1,55 @@
+# SPDX-FileCopyrightText: © 2022-2024 Wojciech Trybus <wojtryb@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from .api_krita import Krita, Document
+
+
+class AnnotationIndex:
+    """
+    Index of annotations stored in the active document.
+
+    Names of annotations are fetched once per document. Their values are
+    decoded on first read, and then taken from the index. Writes update
+    both the document and the index.
+
+    Index is rebuilt when a different document becomes active.
+    """
+
+    def __init__(self) -> None:
+        self._document: Document | None = None
+        self._names: set[str] = set()
+        self._values: dict[str, str] = {}
+
+    def read(self, name: str) -> str | None:
+        """Return decoded annotation or None if it is not stored."""
+        document = self._get_indexed_document()
+        if document is None or name not in self._names:
+            return None
+
+        try:
+            return self._values[name]
+        except KeyError:
+            value = document.read_annotation(name)
+            self._values[name] = value
+            return value
+
+    def write(self, name: str, value: str) -> None:
+        """Write annotation to active document, if there is one."""
+        document = self._get_indexed_document()
+        if document is None:
+            return
+
+        document.write_annotation(name, "", value)
+        self._names.add(name)
+        self._values[name] = value
+
+    def _get_indexed_document(self) -> Document | None:
+        """Return active document, indexing it when it has changed."""
+        document = Krita.get_active_document()
+        if document != self._document:
+            self._document = document
+            self._names = set()
+            self._values = {}
+            if document is not None:
+                self._names.update(document.annotation_types())
+        return document
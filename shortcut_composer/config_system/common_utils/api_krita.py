@@ -78,5 +78,9 @@ class Document:
         """Return if annotation of given name is stored in .kra."""
         return name in self.document.annotationTypes()
 
+    def annotation_types(self) -> list[str]:
+        """Return names of all annotations stored in .kra."""
+        return self.document.annotationTypes()
+
 
 Krita = KritaInstance()
@@ -0,0 +1,90 @@
+# SPDX-FileCopyrightText: © 2022-2024 Wojciech Trybus <wojtryb@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from typing import Any
+
+from .api_krita import Krita, Document
+from .save_location import SaveLocation
+
+
+class ParsedValueCache:
+    """
+    Process-wide storage of field values, already parsed to their types.
+
+    Values are stored per save location, group name and field name.
+    Stored None means, that the value was red, but it is not present in
+    its location.
+
+    Local values are valid only for the document they were red from.
+    They get dropped as soon as a different document becomes active.
+
+    Cache does not notice changes made outside of the plugin. Use
+    `clear()` to force reading all the values again.
+
+    Generation of a location grows each time its values are dropped.
+
+    Generation of a group grows each time any of its fields is changed
+    with `bump()`, and each time values of any location are dropped.
+    Reading it is a single lookup, which does not check the document.
+    """
+
+    def __init__(self) -> None:
+        self._values: dict[SaveLocation, dict[tuple[str, str], Any]] = {
+            location: {} for location in SaveLocation}
+        self._generations = {location: 0 for location in SaveLocation}
+        self._group_changes: dict[str, int] = {}
+        self._drops = 0
+        self._document: Document | None = None
+
+    def get(self, location: SaveLocation, group: str, name: str) -> Any:
+        """Return cached value. Raise KeyError when it was not cached."""
+        if location == SaveLocation.LOCAL:
+            self._drop_local_on_document_change()
+        return self._values[location][(group, name)]
+
+    def set(
+        self,
+        location: SaveLocation,
+        group: str,
+        name: str,
+        value: Any
+    ) -> None:
+        """Store a parsed value. None marks value not present in location."""
+        if location == SaveLocation.LOCAL:
+            self._drop_local_on_document_change()
+        self._values[location][(group, name)] = value
+
+    def generation(self, location: SaveLocation) -> int:
+        """Return number of times values from location were dropped."""
+        if location == SaveLocation.LOCAL:
+            self._drop_local_on_document_change()
+        return self._generations[location]
+
+    def bump(self, group: str) -> None:
+        """Mark that a value of field from given group could change."""
+        self._group_changes[group] = self._group_changes.get(group, 0) + 1
+
+    def group_generation(self, group: str) -> int:
+        """Return number which grows each time group values could change."""
+        return self._group_changes.get(group, 0) + self._drops
+
+    def clear(self, location: SaveLocation | None = None) -> None:
+        """Forget values from given location, or all values if not given."""
+        locations = SaveLocation if location is None else [location]
+        for location_to_clear in locations:
+            self._values[location_to_clear].clear()
+            self._generations[location_to_clear] += 1
+        self._drops += 1
+
+    def _drop_local_on_document_change(self) -> None:
+        """Forget local values if they come from a different document."""
+        document = Krita.get_active_document()
+        if document != self._document:
+            self._values[SaveLocation.LOCAL].clear()
+            self._generations[SaveLocation.LOCAL] += 1
+            self._drops += 1
+            self._document = document
+
+
+FieldCache = ParsedValueCache()
+"""Parsed values of all the fields, shared between all of them."""
@@ -5,6 +5,7 @@ from typing import Any, Protocol
 from enum import Enum
 
 from .api_krita import Krita
+from .annotation_index import AnnotationIndex
 
 
 class SupportsReadWrite(Protocol):
@@ -33,14 +34,18 @@ class GlobalSettings(SupportsReadWrite):
 
 
 class LocalSettings(SupportsReadWrite):
-    """Gives read/write interface to .kra document annotations. """
+    """
+    Gives read/write interface to .kra document annotations.
+
+    Annotations of active document are accessed through shared index.
+    """
+
+    _index = AnnotationIndex()
 
     @staticmethod
     def write(group: str, name: str, value: Any) -> None:
         """Write value to .kra document as its annotation."""
-        document = Krita.get_active_document()
-        if document is not None:
-            document.write_annotation(f"{group} {name}", "",  str(value))
+        LocalSettings._index.write(f"{group} {name}", str(value))
 
     @staticmethod
     def read(
@@ -49,14 +54,10 @@ class LocalSettings(SupportsReadWrite):
         default: str = "Not stored"
     ) -> str | None:
         """Read value from .kra document stored in its annotation."""
-        document = Krita.get_active_document()
-        annotation_name = f"{group} {name}"
-
-        if (document is None
-                or not document.contains_annotation(annotation_name)):
+        value = LocalSettings._index.read(f"{group} {name}")
+        if value is None:
             return None if default == "Not stored" else default
-
-        return document.read_annotation(annotation_name)
+        return value
 
 
 class SaveLocation(Enum):
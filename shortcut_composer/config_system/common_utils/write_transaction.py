@@ -0,0 +1,78 @@
+# SPDX-FileCopyrightText: © 2022-2024 Wojciech Trybus <wojtryb@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from typing import Callable
+
+from .save_location import SaveLocation
+
+
+class WriteTransaction:
+    """
+    Process-wide context deferring writes of fields to their locations.
+
+    Outside of the context, writes and callbacks are performed at once.
+
+    Inside the context, only the latest value written to each field is
+    remembered, and physically written to its location on exit. Each
+    distinct callback requested by written fields is then run only once,
+    in order of the first request.
+
+    Contexts can be nested. Deferred work is done when the outermost
+    one exits. It is also done when the context exits with exception,
+    as written values are already visible to fields through the cache.
+    """
+
+    def __init__(self) -> None:
+        self._depth = 0
+        self._writes: dict[tuple[SaveLocation, str, str], str] = {}
+        self._callbacks: list[Callable[[], None]] = []
+
+    @property
+    def is_active(self) -> bool:
+        """Return whether writes are currently deferred."""
+        return self._depth > 0
+
+    def write(
+        self,
+        location: SaveLocation,
+        group: str,
+        name: str,
+        value: str
+    ) -> None:
+        """Write a value to location now, or when context exits."""
+        if not self.is_active:
+            return location.write(group=group, name=name, value=value)
+        self._writes.pop((location, group, name), None)
+        self._writes[(location, group, name)] = value
+
+    def run_callbacks(self, callbacks: list[Callable[[], None]]) -> None:
+        """Run callbacks now, or when context exits if not run already."""
+        if not self.is_active:
+            for callback in callbacks:
+                callback()
+            return
+
+        for callback in callbacks:
+            if callback not in self._callbacks:
+                self._callbacks.append(callback)
+
+    def __enter__(self) -> 'WriteTransaction':
+        self._depth += 1
+        return self
+
+    def __exit__(self, *_) -> None:
+        self._depth -= 1
+        if self.is_active:
+            return
+
+        writes, self._writes = self._writes, {}
+        for (location, group, name), value in writes.items():
+            location.write(group=group, name=name, value=value)
+
+        callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback()
+
+
+Transaction = WriteTransaction()
+"""Context deferring writes of all the fields."""
@@ -28,12 +28,16 @@ class Field(Generic[T]):
     - `Enum`, `list[Enum]`
 
     For empty, homogeneous lists, `parser_type` argument must be used to
-    determine type of list elements.
+    determine type of list elements. Long lists can be stored in a
+    `compact` form, which takes less space and is faster to parse.
 
     Default values are not saved when until the field does not exist in
     its location. Repeated saves of the same value are filtered, so that
     callbacks are not called when the same value is written multiple
     times one after the other.
+
+    Generation of the field grows each time its value could change. It
+    allows to cache values derived from the field, without callbacks.
     """
 
     def __new__(
@@ -43,6 +47,7 @@ class Field(Generic[T]):
         default: T,
         parser_type: type | None = None,
         local: bool = False,
+        compact: bool = False,
     ) -> 'Field[T]':
         from .field_base_impl import ListField, NonListField
 
@@ -50,7 +55,8 @@ class Field(Generic[T]):
         if not isinstance(default, list):
             return NonListField(
                 config_group, name, default, parser_type, local)
-        return ListField(config_group, name, default, parser_type, local)
+        return ListField(
+            config_group, name, default, parser_type, local, compact)
 
     config_group: str
     """Configuration section in kritarc toml file."""
@@ -72,3 +78,8 @@ class Field(Generic[T]):
     def reset_default(self) -> None:
         """Write a default value to kritarc file."""
         ...
+
+    @property
+    def generation(self) -> int:
+        """Return number which grows each time the value could change."""
+        ...
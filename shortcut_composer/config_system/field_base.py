@@ -5,7 +5,7 @@ from typing import TypeVar, Generic, Callable
 from abc import ABC, abstractmethod
 from enum import Enum
 
-from .common_utils import SaveLocation
+from .common_utils import SaveLocation, FieldCache, Transaction
 from .field import Field
 
 T = TypeVar('T')
@@ -31,33 +31,91 @@ class FieldBase(ABC, Field, Generic[T]):
     ) -> None:
         self.config_group = config_group
         self.name = name
-        self.default = default
+        self._default = default
+        self._changes = 0
         self.parser_type = parser_type
         self.location = SaveLocation.LOCAL if local else SaveLocation.GLOBAL
         self._on_change_callbacks: list[Callable[[], None]] = []
 
+    @property
+    def default(self) -> T:
+        """Default value used when the field is not present in location."""
+        return self._default
+
+    @default.setter
+    def default(self, value: T) -> None:
+        """Change the default value, which may change the red value."""
+        self._default = value
+        self._changes += 1
+        FieldCache.bump(self.config_group)
+
+    @property
+    def generation(self) -> int:
+        """Count writes, default changes and drops of cached values."""
+        return self._changes + FieldCache.generation(self.location)
+
     def register_callback(self, callback: Callable[[], None]) -> None:
         """Store callback in internal list."""
         self._on_change_callbacks.append(callback)
 
     def write(self, value: T) -> None:
-        """Write value to file and run callbacks if it was not redundant."""
+        """
+        Write value to file and run callbacks if it was not redundant.
+
+        Inside of a transaction, writing and running callbacks is deferred.
+        """
         if not isinstance(value, type(self.default)):
             raise TypeError(f"{value} not of type {type(self.default)}")
 
         if self._is_write_redundant(value):
             return
 
-        self.location.write(
+        FieldCache.set(
+            location=self.location,
             group=self.config_group,
             name=self.name,
-            value=self._to_string(value))
-        for callback in self._on_change_callbacks:
-            callback()
+            value=self._copy(value))
+        self._changes += 1
+        FieldCache.bump(self.config_group)
+        self._write_raw(self._to_string(value))
+        Transaction.run_callbacks(self._on_change_callbacks)
 
-    @abstractmethod
     def read(self) -> T:
         """Return value from kritarc parsed to field type."""
+        value = self._read_stored()
+        return self._copy(self.default if value is None else value)
+
+    def _read_stored(self) -> T | None:
+        """
+        Return parsed value stored in location or None if not stored.
+
+        Value is parsed only on first read, and then taken from cache.
+        """
+        try:
+            return FieldCache.get(self.location, self.config_group, self.name)
+        except KeyError:
+            pass
+
+        raw = self._read_raw()
+        value = None if raw is None else self._from_string(raw)
+        FieldCache.set(self.location, self.config_group, self.name, value)
+        return value
+
+    def _write_raw(self, raw: str) -> None:
+        """Write a string representing the value to location."""
+        Transaction.write(
+            location=self.location,
+            group=self.config_group,
+            name=self.name,
+            value=raw)
+
+    def _read_raw(self) -> str | None:
+        """Read a string representing the value. None if not stored."""
+        return self.location.read(self.config_group, self.name)
+
+    @abstractmethod
+    def _from_string(self, raw: str) -> T:
+        """Parse a string read from location to field type."""
         ...
 
     @abstractmethod
@@ -65,6 +123,11 @@ class FieldBase(ABC, Field, Generic[T]):
         """Convert a value of field type to string."""
         ...
 
+    @abstractmethod
+    def _copy(self, value: T) -> T:
+        """Return a copy of value, which does not affect the cached one."""
+        ...
+
     def _is_write_redundant(self, value: T) -> bool:
         """
         Return if writing a value is not necessary.
@@ -73,10 +136,10 @@ class FieldBase(ABC, Field, Generic[T]):
         - the value is the same as the one stored in file
         - value is a default one and it is not present in file
         """
-        if self.read() == value:
-            return True
-        raw = self.location.read(self.config_group, self.name)
-        return raw is None and value == self.default
+        stored = self._read_stored()
+        if stored is None:
+            return value == self.default
+        return stored == value
 
     def reset_default(self) -> None:
         """Write a default value to kritarc file."""
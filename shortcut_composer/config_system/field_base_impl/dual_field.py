@@ -2,7 +2,9 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 from typing import Callable, Generic, TypeVar
+from weakref import WeakSet
 
+from ..common_utils import Transaction
 from ..field import Field
 from ..field_group import FieldGroup
 
@@ -20,7 +22,14 @@ class DualField(Field, Generic[T]):
 
     NOTE: Callbacks are always stored in the global field, as they
     wouldn't run in local one when switching between documents.
+
+    All existing DualFields can be refreshed at once with `refresh_all`
+    when the active document changes.
     """
+
+    _instances: 'WeakSet[DualField]' = WeakSet()
+    """All created dual fields, which are still in use."""
+
     def __new__(cls, *args, **kwargs) -> 'DualField[T]':
         obj = object.__new__(cls)
         obj.__init__(*args, **kwargs)
@@ -32,14 +41,18 @@ class DualField(Field, Generic[T]):
         is_local_determiner: Field[bool],
         field_name: str,
         default: T,
-        parser_type: type | None = None
+        parser_type: type | None = None,
+        compact: bool = False,
     ) -> None:
         self.name = field_name
         self.config_group = group.name
         self._is_local_determiner = is_local_determiner
         self._is_local_determiner.register_callback(self.refresh)
-        self._loc = group.field(field_name, default, parser_type, local=True)
-        self._glob = group.field(field_name, default, parser_type, local=False)
+        self._loc = group.field(
+            field_name, default, parser_type, local=True, compact=compact)
+        self._glob = group.field(
+            field_name, default, parser_type, local=False, compact=compact)
+        self._instances.add(self)
 
     @property
     def default(self) -> T:
@@ -74,6 +87,13 @@ class DualField(Field, Generic[T]):
         self._loc.reset_default()
         self._glob.reset_default()
 
+    @property
+    def generation(self) -> int:
+        """Sum generations of both fields and the determiner."""
+        return (self._loc.generation
+                + self._glob.generation
+                + self._is_local_determiner.generation)
+
     def refresh(self) -> None:
         """
         Write red value back to itself.
@@ -81,3 +101,16 @@ class DualField(Field, Generic[T]):
         not run callbacks.
         """
         self.write(self.read())
+
+    @classmethod
+    def refresh_all(cls) -> None:
+        """
+        Refresh all fields saved locally, in a single transaction.
+
+        Only fields which value differs between documents get written,
+        and each affected callback is run once.
+        """
+        with Transaction:
+            for field in list(cls._instances):
+                if field._is_local_determiner.read():
+                    field.refresh()
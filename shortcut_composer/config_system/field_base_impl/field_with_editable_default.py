@@ -47,3 +47,7 @@ class FieldWithEditableDefault(Field, Generic[T, F]):
 
     def reset_default(self) -> None:
         self.field.reset_default()
+
+    @property
+    def generation(self) -> int:
+        return self.field.generation + self._default_field.generation
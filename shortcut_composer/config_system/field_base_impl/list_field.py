@@ -1,8 +1,11 @@
 # SPDX-FileCopyrightText: © 2022-2024 Wojciech Trybus <wojtryb@gmail.com>
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+import zlib
+from base64 import b64decode, b64encode
 from typing import TypeVar, Generic
 
+from ..common_utils import Transaction
 from ..field_base import FieldBase
 from .common_utils import dispatch_parser
 
@@ -10,7 +13,23 @@ T = TypeVar('T')
 
 
 class ListField(FieldBase, Generic[T]):
-    """Config field containing a list value."""
+    """
+    Config field containing a list value.
+
+    Elements are stored as a string separated with tabs.
+
+    In compact mode, lists longer than `COMPACT_THRESHOLD` characters
+    are stored compressed and encoded in base64, in a separate entry with
+    `COMPACT_SUFFIX` added to the field name. Regular entry is left
+    untouched then, so that older versions of the plugin, which do not
+    know the compressed entry, still read a valid list from it. Empty
+    compressed entry means that the regular one is up to date.
+    """
+
+    COMPACT_THRESHOLD = 1024
+    """Length of tab-separated string above which it gets compressed."""
+    COMPACT_SUFFIX = " (compressed)"
+    """Added to the field name to form the name of compressed entry."""
 
     def __init__(
         self,
@@ -19,9 +38,12 @@ class ListField(FieldBase, Generic[T]):
         default: list[T],
         parser_type: type | None = None,
         local: bool = False,
+        compact: bool = False,
     ) -> None:
         super().__init__(config_group, name, default, parser_type, local)
         self._parser = dispatch_parser(self._get_type(self.parser_type))
+        self._compact = compact
+        self._is_compressed_used: bool | None = None
 
     def write(self, value: list[T]) -> None:
         for element in value:
@@ -42,22 +64,73 @@ class ListField(FieldBase, Generic[T]):
             return passed_type
         return type(self.default[0])
 
-    def read(self) -> list[T]:
+    def _from_string(self, raw: str) -> list[T]:
+        """Parse string read from location to list of field type."""
+        if raw == "":
+            return []
+        return [self._parser.parse_to(item) for item in raw.split("\t")]
+
+    def _to_string(self, value: list[T]) -> str:
+        """Convert list of values to string by parsing each element alone."""
+        return "\t".join(self._parser.parse_from(item) for item in value)
+
+    def _write_raw(self, raw: str) -> None:
         """
-        Return value from kritarc parsed to field type.
+        Write tab-separated string to location.
 
-        Each list element requires parsing.
+        In compact mode, long strings are compressed and written to the
+        compressed entry instead.
         """
-        raw = self.location.read(self.config_group, self.name)
-        if raw is None:
-            return self.default
+        if not self._compact:
+            return super()._write_raw(raw)
 
-        if raw == "":
-            return []
+        if len(raw) <= self.COMPACT_THRESHOLD:
+            self._write_compressed("")
+            return super()._write_raw(raw)
+        self._write_compressed(self._compress(raw))
 
-        values_list = raw.split("\t")
-        return [self._parser.parse_to(value) for value in values_list]
+    def _read_raw(self) -> str | None:
+        """Read tab-separated string, from the compressed entry if used."""
+        if self._compact:
+            compressed = self.location.read(
+                self.config_group, self._compressed_name)
+            self._is_compressed_used = bool(compressed)
+            if compressed:
+                try:
+                    return self._decompress(compressed)
+                except (ValueError, zlib.error):
+                    pass
+        return super()._read_raw()
 
-    def _to_string(self, value: list[T]) -> str:
-        """Convert list of values to string by parsing each element alone."""
-        return "\t".join([self._parser.parse_from(item) for item in value])
+    @property
+    def _compressed_name(self) -> str:
+        """Return name of entry holding the compressed value."""
+        return f"{self.name}{self.COMPACT_SUFFIX}"
+
+    def _write_compressed(self, compressed: str) -> None:
+        """Write to the compressed entry, if it is used or about to be."""
+        if self._is_compressed_used is None:
+            self._is_compressed_used = bool(self.location.read(
+                self.config_group, self._compressed_name))
+        if not compressed and not self._is_compressed_used:
+            return
+        self._is_compressed_used = bool(compressed)
+        Transaction.write(
+            location=self.location,
+            group=self.config_group,
+            name=self._compressed_name,
+            value=compressed)
+
+    @staticmethod
+    def _compress(raw: str) -> str:
+        """Return string compressed and encoded in base64."""
+        return b64encode(zlib.compress(raw.encode())).decode("ascii")
+
+    @staticmethod
+    def _decompress(compressed: str) -> str:
+        """Return string from compressed one, encoded in base64."""
+        return zlib.decompress(b64decode(compressed)).decode()
+
+    def _copy(self, value: list[T]) -> list[T]:
+        """Return a shallow copy of the list, as its elements are immutable."""
+        return list(value)
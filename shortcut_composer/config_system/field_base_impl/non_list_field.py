@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 from typing import TypeVar, Generic
+from copy import copy
 
 from ..field_base import FieldBase
 from .common_utils import dispatch_parser
@@ -19,17 +20,21 @@ class NonListField(FieldBase, Generic[T]):
         default: T,
         parser_type: type | None = None,
         local: bool = False,
+        compact: bool = False,
     ) -> None:
+        # Compact form applies only to lists. The flag is accepted, as
+        # Field passes the same arguments to all field types
         super().__init__(config_group, name, default, parser_type, local)
         self._parser = dispatch_parser(type(self.default))
 
-    def read(self) -> T:
-        """Return value from kritarc parsed to field type."""
-        raw = self.location.read(self.config_group, self.name)
-        if raw is None:
-            return self.default
+    def _from_string(self, raw: str) -> T:
+        """Parse a string read from location using parser."""
         return self._parser.parse_to(raw)
 
     def _to_string(self, value: T) -> str:
         """Parse the field value to string using parser."""
         return self._parser.parse_from(value)
+
+    def _copy(self, value: T) -> T:
+        """Return a copy of value, as some types (QColor) are mutable."""
+        return copy(value)
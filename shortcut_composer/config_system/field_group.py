@@ -2,7 +2,9 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 from typing import TypeVar, Callable, Iterator
+from contextlib import contextmanager
 
+from .common_utils import Transaction, FieldCache
 from .field import Field
 
 T = TypeVar('T')
@@ -19,6 +21,12 @@ class FieldGroup:
 
     Allows to reset all the fields at once, and register a callback to
     all its fields: both existing and future ones.
+
+    Writes performed inside `transaction()` context are deferred until
+    it ends. Each distinct callback is then run only once.
+
+    Generation of the group grows each time any of its fields could
+    change, which allows to cache values derived from them.
     """
 
     def __init__(self, name: str) -> None:
@@ -32,9 +40,10 @@ class FieldGroup:
         default: T,
         parser_type: type | None = None,
         local: bool = False,
+        compact: bool = False,
     ) -> Field[T]:
         """Create and return a new field in the group."""
-        field = Field(self.name, name, default, parser_type, local)
+        field = Field(self.name, name, default, parser_type, local, compact)
         self._fields.append(field)
         for callback in self._callbacks:
             field.register_callback(callback)
@@ -42,8 +51,21 @@ class FieldGroup:
 
     def reset_default(self) -> None:
         """Reset values of all fields stored in this group."""
-        for field in self._fields:
-            field.reset_default()
+        with self.transaction():
+            for field in self._fields:
+                field.reset_default()
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """
+        Defer writes of fields and coalesce their callbacks.
+
+        Red values change immediately, but physical writes and callbacks
+        are postponed until the outermost transaction ends. Transaction
+        is shared with all the other groups.
+        """
+        with Transaction:
+            yield
 
     def register_callback(self, callback: Callable[[], None]) -> None:
         """Register a callback on every past and future field in group."""
@@ -51,6 +73,16 @@ class FieldGroup:
         for field in self._fields:
             field.register_callback(callback)
 
+    @property
+    def generation(self) -> int:
+        """
+        Return number which grows each time any field could change.
+
+        Fields of the group report their changes to the shared cache, so
+        reading the generation does not depend on amount of fields.
+        """
+        return FieldCache.group_generation(self.name)
+
     def __iter__(self) -> Iterator[Field]:
         """Iterate over all fields in the group."""
         return iter(self._fields)
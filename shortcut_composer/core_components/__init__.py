@@ -12,10 +12,12 @@ concrete implementations are stored in respective packages.
 
 from .instruction_base import Instruction, InstructionHolder
 from .controller_base import Controller, NumericController
+from .write_scheduler import WriteScheduler
 
 __all__ = [
     'InstructionHolder',
     'Instruction',
     'Controller',
     'NumericController',
+    'WriteScheduler',
 ]
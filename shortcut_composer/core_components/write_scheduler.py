@@ -0,0 +1,78 @@
+# SPDX-FileCopyrightText: © 2022-2024 Wojciech Trybus <wojtryb@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from time import perf_counter
+from typing import Any, Generic, TypeVar
+
+from api_krita.pyqt import FrameClock, FramePhase
+from .controller_base import Controller
+
+T = TypeVar("T")
+
+_NOTHING: Any = object()
+"""Marker of a value that was not requested, or not yet written."""
+
+
+class WriteScheduler(Generic[T]):
+    """
+    Sets values of a controller at most once per frame.
+
+    Values are requested with `request()`, and written in the actuate
+    phase of the frame. Only the latest value requested before the
+    frame is written, and value equal to the last written is skipped.
+
+    Average time of writing a value is measured. After each write,
+    scheduler waits at least that long before the next one, so that
+    slow controllers do not take up the whole frame time of krita.
+
+    Scheduler works between `start()` and `stop()` calls. Stopping
+    writes the pending value immediately.
+    """
+
+    def __init__(self, controller: Controller[T], smoothing: float = 0.2):
+        self._controller = controller
+        self._smoothing = smoothing
+        self._average_cost = 0.0
+        self._next_write_time = 0.0
+        self._last_written: T = _NOTHING
+        self._pending: T = _NOTHING
+
+    def start(self) -> None:
+        """Forget the last written value, as it could change meanwhile."""
+        self._last_written = _NOTHING
+        self._pending = _NOTHING
+        self._next_write_time = 0.0
+
+    def request(self, value: T) -> None:
+        """Schedule writing the value, replacing the one not yet written."""
+        if self._pending is _NOTHING and value == self._last_written:
+            return
+        self._pending = value
+        FrameClock.subscribe(self._on_frame, FramePhase.ACTUATE)
+
+    def stop(self) -> None:
+        """Write the pending value immediately and stop writing."""
+        FrameClock.unsubscribe(self._on_frame)
+        self._write()
+
+    def _on_frame(self) -> None:
+        """Write the pending value if the controller had time to rest."""
+        if perf_counter() < self._next_write_time:
+            return
+        FrameClock.unsubscribe(self._on_frame)
+        self._write()
+
+    def _write(self) -> None:
+        """Write the pending value and measure the time it took."""
+        value, self._pending = self._pending, _NOTHING
+        if value is _NOTHING or value == self._last_written:
+            return
+
+        start = perf_counter()
+        self._controller.set_value(value)
+        end = perf_counter()
+
+        self._last_written = value
+        self._average_cost += self._smoothing*(
+            end - start - self._average_cost)
+        self._next_write_time = end + self._average_cost
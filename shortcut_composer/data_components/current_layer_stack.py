@@ -18,6 +18,8 @@ class CurrentLayerStack(list):
 
     For more info about available strategies, check `PickStrategy`.
 
+    Version of the stack grows each time its nodes change.
+
     ### Example usage:
     ```python
     CurrentLayerStack(PickStrategy.CURRENT_VISIBILITY)
@@ -26,6 +28,7 @@ class CurrentLayerStack(list):
 
     def __init__(self, pick_strategy: PickStrategy = PickStrategy.ALL) -> None:
         self.pick_strategy = pick_strategy
+        self.version = 0
 
     def get_layers(self) -> list[Node]:
         """Use PickStrategy to fetch and filter nodes from the document."""
@@ -35,6 +38,9 @@ class CurrentLayerStack(list):
 
     def __len__(self) -> int:
         """HACK: refresh stack here as handler calls it only once on start."""
-        self.clear()
-        self.extend(self.get_layers())
+        layers = self.get_layers()
+        if layers != self:
+            self.clear()
+            self.extend(layers)
+            self.version += 1
         return super().__len__()
@@ -6,16 +6,24 @@ from config_system import Field
 
 
 class Tag(list[str]):
-    """List representing names of presets in a tag of given name."""
+    """
+    List representing names of presets in a tag of given name.
+
+    Version of the tag grows each time its presets change.
+    """
 
     def __init__(self, tag_name: str) -> None:
         self.tag_name = tag_name
+        self.version = 0
         self.refresh()
 
     def refresh(self) -> None:
         """Update itself with current list of presets that belong to tag."""
-        self.clear()
-        self.extend(self._read_presets())
+        presets = self._read_presets()
+        if presets != self:
+            self.clear()
+            self.extend(presets)
+            self.version += 1
 
     def _read_presets(self) -> list[str]:
         """
@@ -26,9 +34,16 @@ class Tag(list[str]):
         with Database() as database:
             from_krita = database.get_preset_names_from_tag(self.tag_name)
 
-        field = Field("ShortcutComposer: Tag order", self.tag_name, [], str)
+        field = Field(
+            config_group="ShortcutComposer: Tag order",
+            name=self.tag_name,
+            default=[],
+            parser_type=str,
+            compact=True)
         from_config = field.read()
 
-        preset_order = [p for p in from_config if p in from_krita]
-        missing = [p for p in from_krita if p not in from_config]
+        krita_names = set(from_krita)
+        config_names = set(from_config)
+        preset_order = [p for p in from_config if p in krita_names]
+        missing = [p for p in from_krita if p not in config_names]
         return preset_order + missing
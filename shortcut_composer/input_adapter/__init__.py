@@ -10,11 +10,23 @@ ComplexAction (public) that supports:
 - key releasing
 - distinguishing between short and long key presses
 
+LazyAction (public) wraps action type with its arguments, and creates
+the action only when its key gets pressed for the first time.
+
+Latency (public) measures time from the key press to the moment the
+action gets painted, so that slow actions can be found.
+
 It has no external dependencies, so that it can be copy-pasted to any
 other krita plugin.
 """
 
 from .action_manager import ActionManager
 from .complex_action_interface import ComplexActionInterface
+from .lazy_action import LazyAction
+from .latency_tracker import Latency
 
-__all__ = ['ActionManager', 'ComplexActionInterface']
+__all__ = [
+    'ActionManager',
+    'ComplexActionInterface',
+    'LazyAction',
+    'Latency']
@@ -6,6 +6,7 @@ from time import time
 from PyQt5.QtGui import QKeyEvent
 
 from ..complex_action_interface import ComplexActionInterface
+from ..latency_tracker import Latency
 
 
 class ShortcutAdapter:
@@ -35,6 +36,7 @@ class ShortcutAdapter:
         """Run action's on_key_press() and remember the time of it."""
         self.local_lock = True
         self.last_press_time = time()
+        Latency.begin(self.action.name)
         self.action.on_key_press()
 
     def event_filter_callback(self, release_event: QKeyEvent) -> None:
@@ -44,6 +46,7 @@ class ShortcutAdapter:
 
     def _on_key_release(self) -> None:
         """Run proper key release methods based on time elapsed from press."""
+        Latency.cancel()
         elapsed_time = time() - self.last_press_time
         if elapsed_time < self.action.short_vs_long_press_time:
             self.action.on_short_key_release()
@@ -1,7 +1,7 @@
 # SPDX-FileCopyrightText: © 2022-2024 Wojciech Trybus <wojtryb@gmail.com>
 # SPDX-License-Identifier: GPL-3.0-or-later
 
-from typing import Protocol
+from typing import Iterator, Protocol
 
 
 class ComplexActionInterface(Protocol):
@@ -28,3 +28,11 @@ class ComplexActionInterface(Protocol):
 
     def on_every_key_release(self) -> None:
         """Called on each release of related key, after short/long callback."""
+
+    def warm_up(self) -> Iterator[None]:
+        """
+        Prepare the action for the first key press in small steps.
+
+        Each step is performed when the next element is requested.
+        """
+        return iter(())
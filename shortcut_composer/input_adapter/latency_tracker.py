@@ -0,0 +1,134 @@
+# SPDX-FileCopyrightText: © 2022-2024 Wojciech Trybus <wojtryb@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from time import perf_counter_ns
+from collections import deque
+
+HISTOGRAM_BOUNDS_MS = (1, 2, 4, 8, 16, 32, 64, 128, 256)
+"""Upper bounds of histogram buckets. Last bucket holds longer samples."""
+
+
+class LatencyTracker:
+    """
+    Measures time between the key press and the first paint of action.
+
+    Measurement starts with `begin()` when the key is pressed. Action
+    can then `mark()` the end of its consecutive stages, and finally
+    call `finish()` when its widget gets painted. Finishing is ignored
+    when it comes from a different action than the measured one.
+    Measurement which did not finish before the key release is dropped
+    with `cancel()`.
+
+    Last `history` measurements are kept separately for each action,
+    and can be presented as a text `report()` or saved with `dump()`.
+    """
+
+    def __init__(self, history: int = 100) -> None:
+        self._history = history
+        self._samples: dict[str, deque[list[tuple[str, int]]]] = {}
+        self._name: str | None = None
+        self._stages: list[tuple[str, int]] = []
+        self._last_mark = 0
+
+    def begin(self, name: str) -> None:
+        """Start measuring latency of action with given name."""
+        self._name = name
+        self._stages = []
+        self._last_mark = perf_counter_ns()
+
+    def mark(self, stage: str) -> None:
+        """Remember time elapsed since the previous stage."""
+        if self._name is None:
+            return
+        now = perf_counter_ns()
+        self._stages.append((stage, now - self._last_mark))
+        self._last_mark = now
+
+    def finish(self, name: str, stage: str = "paint") -> None:
+        """Mark the last stage of action, and store the measurement."""
+        if self._name is None or self._name != name:
+            return
+        self.mark(stage)
+        samples = self._samples.setdefault(
+            self._name, deque(maxlen=self._history))
+        samples.append(self._stages)
+        self._name = None
+
+    def cancel(self) -> None:
+        """Drop the measurement in progress."""
+        self._name = None
+
+    def clear(self) -> None:
+        """Drop all stored measurements."""
+        self._samples.clear()
+        self._name = None
+
+    def report(self) -> str:
+        """Return text summary of stored measurements of all actions."""
+        if not self._samples:
+            return "No measurements yet. Use pie menus or selectors first."
+        return "\n\n".join(
+            self._report_action(name, list(samples))
+            for name, samples in sorted(self._samples.items()))
+
+    def dump(self, path: str) -> None:
+        """Write the text report to a file."""
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(self.report() + "\n")
+
+    def _report_action(
+        self,
+        name: str,
+        samples: list[list[tuple[str, int]]],
+    ) -> str:
+        """Return text summary of measurements of a single action."""
+        totals = sorted(sum(d for _, d in stages) for stages in samples)
+
+        stage_durations: dict[str, list[int]] = {}
+        for stages in samples:
+            for stage, duration in stages:
+                stage_durations.setdefault(stage, []).append(duration)
+
+        lines = [
+            f"{name} ({len(samples)} samples)",
+            f"  total: median {_ms(_percentile(totals, 0.5))}, "
+            f"p90 {_ms(_percentile(totals, 0.9))}, "
+            f"max {_ms(totals[-1])}",
+            f"  histogram: {_histogram(totals)}",
+            "  stages (median):"]
+        for stage, durations in stage_durations.items():
+            durations.sort()
+            lines.append(f"    {stage}: {_ms(_percentile(durations, 0.5))}")
+        return "\n".join(lines)
+
+
+def _percentile(sorted_values: list[int], fraction: float) -> int:
+    """Return value below which given fraction of values lies."""
+    index = min(int(len(sorted_values)*fraction), len(sorted_values)-1)
+    return sorted_values[index]
+
+
+def _histogram(values: list[int]) -> str:
+    """Return amount of values in each bucket as text."""
+    counts = [0] * (len(HISTOGRAM_BOUNDS_MS)+1)
+    for value in values:
+        bucket = 0
+        while (bucket < len(HISTOGRAM_BOUNDS_MS)
+               and value >= HISTOGRAM_BOUNDS_MS[bucket]*1_000_000):
+            bucket += 1
+        counts[bucket] += 1
+
+    labels = [f"<{bound}ms" for bound in HISTOGRAM_BOUNDS_MS]
+    labels.append(f">={HISTOGRAM_BOUNDS_MS[-1]}ms")
+    return ", ".join(
+        f"{label}: {count}"
+        for label, count in zip(labels, counts) if count)
+
+
+def _ms(nanoseconds: int) -> str:
+    """Format nanoseconds as milliseconds."""
+    return f"{nanoseconds/1_000_000:.2f}ms"
+
+
+Latency = LatencyTracker()
+"""Latency of actions, from key press to the first paint."""
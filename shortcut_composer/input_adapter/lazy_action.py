@@ -0,0 +1,80 @@
+# SPDX-FileCopyrightText: © 2022-2024 Wojciech Trybus <wojtryb@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from typing import Any, Callable, Iterator
+
+from .complex_action_interface import ComplexActionInterface
+from .latency_tracker import Latency
+
+
+class LazyAction(ComplexActionInterface):
+    """
+    Proxy of action, which creates it only when it is needed.
+
+    Stores the action type with arguments of its constructor, and
+    creates the action on first key press, or on `build()` call.
+    All the events are then forwarded to the created action.
+
+    Only the `name` argument is required to bind the proxy to krita.
+
+    ### Example usage:
+    ```python
+    LazyAction(
+        CustomAction,
+        name="Custom action name",
+        press_time=0.2,
+    )
+    ```
+    """
+
+    def __init__(
+        self,
+        action_type: Callable[..., ComplexActionInterface],
+        **kwargs: Any
+    ) -> None:
+        self.name: str = kwargs["name"]
+        self._action_type = action_type
+        self._kwargs = kwargs
+        self._action: ComplexActionInterface | None = None
+
+    @property
+    def is_built(self) -> bool:
+        """Return whether the action was already created."""
+        return self._action is not None
+
+    def build(self) -> ComplexActionInterface:
+        """Create the action if it does not exist yet and return it."""
+        if self._action is None:
+            self._action = self._action_type(**self._kwargs)
+            self._kwargs = {}
+        return self._action
+
+    def warm_up(self) -> Iterator[None]:
+        """Create the action in the first step, and then warm it up."""
+        action = self.build()
+        yield
+        yield from action.warm_up()
+
+    @property
+    def short_vs_long_press_time(self) -> float:
+        """Time [s] that specifies if key press is short or long."""
+        return self.build().short_vs_long_press_time
+
+    def on_key_press(self) -> None:
+        """Create the action if needed and forward key press to it."""
+        if not self.is_built:
+            self.build()
+            Latency.mark("build")
+        self.build().on_key_press()
+
+    def on_short_key_release(self) -> None:
+        """Forward short key release to the action."""
+        self.build().on_short_key_release()
+
+    def on_long_key_release(self) -> None:
+        """Forward long key release to the action."""
+        self.build().on_long_key_release()
+
+    def on_every_key_release(self) -> None:
+        """Forward every key release to the action."""
+        self.build().on_every_key_release()
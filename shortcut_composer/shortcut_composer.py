@@ -7,9 +7,14 @@ from PyQt5.QtWidgets import QWidgetAction
 from krita import Extension
 from api_krita import Krita
 from api_krita.actions import TransformModeActions
+from api_krita.pyqt import IdleQueue, FrameClock
 from actions import create_actions
-from composer_utils import SettingsDialog
-from input_adapter import ActionManager
+from config_system import FieldCache
+from config_system.field_base_impl import DualField
+from composer_utils import SettingsDialog, Config
+from composer_utils.label import PixmapCache
+from templates.pie_menu_utils import PieLabelCache
+from input_adapter import ActionManager, LazyAction
 
 
 @dataclass
@@ -43,7 +48,9 @@ class ShortcutComposer(Extension):
         """Add callback to reload actions on theme change."""
         super().__init__(parent)
         self._protectors: list[GarbageProtector] = []
+        self._warm_up_queue = IdleQueue()
         Krita.add_theme_change_callback(self._reload_composer)
+        Krita.add_application_closing_callback(Config.save_used_actions)
 
     def setup(self) -> None: """Obligatory abstract method override."""
 
@@ -56,6 +63,7 @@ class ShortcutComposer(Extension):
             action_manager=ActionManager(window),
             reload_action=self._create_reload_action(window)))
 
+        window.activeViewChanged.connect(DualField.refresh_all)
         self._reload_composer()
 
     def _reload_composer(self) -> None:
@@ -64,9 +72,30 @@ class ShortcutComposer(Extension):
             if not protector.is_alive():
                 self._protectors.remove(protector)
 
+        Config.save_used_actions()
+        FieldCache.clear()
+        PixmapCache.clear()
+        PieLabelCache.clear_all()
+        FrameClock.set_interval(Config.get_sleep_time())
+        self._warm_up_queue.clear()
         for protector in self._protectors:
-            for action in create_actions():
+            actions = create_actions()
+            for action in actions:
                 protector.action_manager.bind_action(action)
+            self._warm_up(actions)
+
+    def _warm_up(self, actions: list[LazyAction]) -> None:
+        """
+        Prepare recently used actions in the background, when idle.
+
+        Recently used actions get created and warmed up entirely, so
+        that their widgets are ready. The rest of actions is created
+        only when triggered for the first time.
+        """
+        actions_by_name = {action.name: action for action in actions}
+        for name in Config.get_used_actions():
+            if name in actions_by_name:
+                self._warm_up_queue.add(actions_by_name[name].warm_up())
 
     def _create_settings_action(
         self,
@@ -1,8 +1,7 @@
 # SPDX-FileCopyrightText: © 2022-2024 Wojciech Trybus <wojtryb@gmail.com>
 # SPDX-License-Identifier: GPL-3.0-or-later
 
-from api_krita import Krita
-from api_krita.pyqt import Timer
+from api_krita.pyqt import MouseMoveFilter, MotionSample
 from core_components import Instruction
 from templates.raw_instructions import RawInstructions
 from .slider_handler import SliderHandler
@@ -60,21 +59,27 @@ class DoubleAxisTracker(RawInstructions):
 
         self._horizontal_handler = horizontal_handler
         self._vertical_handler = vertical_handler
-        self._timer = Timer(self._start_after_picking_slider, interval_ms=50)
+        self._move_filter = MouseMoveFilter(self._start_after_picking_slider)
+        self._start_sample: MotionSample | None = None
 
     def on_key_press(self) -> None:
-        """Start a timer which decides which handler to start."""
+        """Start checking on every mouse motion which handler to start."""
         super().on_key_press()
-        self._comparator = self.MouseComparator()
-        self._timer.start()
+        self._start_sample = None
+        self._move_filter.start()
 
-    def _start_after_picking_slider(self) -> None:
+    def _start_after_picking_slider(self, sample: MotionSample) -> None:
         """Wait for initial movement to activate the right handler."""
-        if self._comparator.delta_x <= 25 and self._comparator.delta_y <= 25:
+        if self._start_sample is None:
+            self._start_sample = sample
             return
-        self._timer.stop()
+        delta_x = abs(sample.x - self._start_sample.x)
+        delta_y = abs(sample.y - self._start_sample.y)
+        if delta_x <= 25 and delta_y <= 25:
+            return
+        self._move_filter.stop()
 
-        if self._comparator.is_horizontal:
+        if delta_x > delta_y:
             self._horizontal_handler.start()
         else:
             self._vertical_handler.start()
@@ -82,30 +87,6 @@ class DoubleAxisTracker(RawInstructions):
     def on_every_key_release(self) -> None:
         """End tracking with handler, regardless of which one was started."""
         super().on_every_key_release()
-        self._timer.stop()
+        self._move_filter.stop()
         self._horizontal_handler.stop()
         self._vertical_handler.stop()
-
-    class MouseComparator:
-        """Compares current mouse position with position from init phase."""
-
-        def __init__(self) -> None:
-            """Store cursor position provider and store starting position."""
-            self.cursor = Krita.get_cursor()
-            self.start_x = self.cursor.x()
-            self.start_y = self.cursor.y()
-
-        @property
-        def delta_x(self) -> int:
-            """Offset of current position from starting one in x axis."""
-            return abs(self.start_x - self.cursor.x())
-
-        @property
-        def delta_y(self) -> int:
-            """Offset of current position from starting one in y axis."""
-            return abs(self.start_y - self.cursor.y())
-
-        @property
-        def is_horizontal(self) -> bool:
-            """Is offset in x axis bigger than in y axis."""
-            return self.delta_x > self.delta_y
@@ -1,11 +1,10 @@
 # SPDX-FileCopyrightText: © 2022-2024 Wojciech Trybus <wojtryb@gmail.com>
 # SPDX-License-Identifier: GPL-3.0-or-later
 
-from typing import Callable, Iterable, Generic, TypeVar
+from typing import Iterable, Generic, TypeVar
 
-from api_krita import Krita
-from api_krita.pyqt import Timer
-from composer_utils import Config
+from api_krita.pyqt import MouseMoveFilter, MotionSample
+from core_components import WriteScheduler
 from data_components import Slider, Range
 from .new_types import MouseInput, Interpreted
 from .mouse_interpreter import MouseInterpreter
@@ -16,7 +15,6 @@ from .slider_values import (
 )
 
 T = TypeVar("T")
-MouseGetter = Callable[[], MouseInput]
 
 
 class SliderHandler(Generic[T]):
@@ -33,20 +31,25 @@ class SliderHandler(Generic[T]):
 
     The handler is running between `start()` and `stop()` calls.
 
+    The handler gets samples of the cursor position from the frame
+    clock, at most once per frame and only when the mouse moved. First
+    sample, reported on start, is used as the starting point.
+
     Right after start, the handler waits for the mouse to move past the
     deadzone, which allows to prevent unwanted changes.
 
     After the deadzone is reached, the value interpreter is created
-    using the current mouse position.
+    using the mouse position which crossed it.
 
-    Main handler loop starts:
+    Main handler phase starts, on every mouse sample:
     - the mouse offset is being interpreted
     - interpreted values allow to fetch controller compatible values
       from the `SliderValues`
-    - `SliderValues` values are being set using the controller.
+    - `SliderValues` values are being set using the controller, at most
+      once per frame.
 
     Calling stop cancels the process at any step, including deadzone
-    phase in which case main loop will never be started.
+    phase in which case main phase will never be started.
     """
 
     def __init__(self, slider: Slider[T], is_horizontal: bool) -> None:
@@ -54,57 +57,50 @@ class SliderHandler(Generic[T]):
         self._slider = slider
         self._to_cycle = self._create_slider_values(slider)
         self._is_horizontal = is_horizontal
+        self._writer = WriteScheduler(slider.controller)
+        self._move_filter = MouseMoveFilter(self._handle_motion)
+        self._is_past_deadzone = False
 
-        sleep_time = Config.get_sleep_time()
-        self._deadzone_timer = Timer(
-            target=self._start_after_deadzone,
-            interval_ms=sleep_time)
-        self._main_timer = Timer(
-            target=self._value_setting_loop,
-            interval_ms=sleep_time)
-
-        self._mouse_getter: MouseGetter
-        self._start_point: MouseInput
+        self._start_point: MouseInput | None = None
         self._interpreter: MouseInterpreter
 
     def start(self) -> None:
-        """Start a deadzone phase in a timer."""
-        self._working = True
+        """Start a deadzone phase, checked on every mouse motion."""
         self._slider.controller.refresh()
-        self._mouse_getter = self._pick_mouse_getter()
-        self._start_point = self.read_mouse()
-        self._deadzone_timer.start()
+        self._writer.start()
+        self._start_point = None
+        self._is_past_deadzone = False
+        self._move_filter.start()
 
     def stop(self) -> None:
-        """Stop a process by stopping any timers."""
-        self._deadzone_timer.stop()
-        self._main_timer.stop()
-
-    def read_mouse(self) -> MouseInput:
-        """Fetch current mouse position."""
-        return self._mouse_getter()
-
-    def _start_after_deadzone(self) -> None:
-        """Block a thread until mouse reaches deadzone. Then start a loop."""
-        current = self.read_mouse()
-        if abs(self._start_point - current) <= self._slider.deadzone:
-            return
-        self._deadzone_timer.stop()
-        self._update_interpreter()
-        self._main_timer.start()
-
-    def _value_setting_loop(self) -> None:
-        """Set current value from `SliderValues`."""
-        clipped_value = self._interpreter.interpret(self.read_mouse())
+        """Stop a process by no longer listening to mouse motion."""
+        self._move_filter.stop()
+        self._writer.stop()
+
+    def _handle_motion(self, sample: MotionSample) -> None:
+        """Pass the mouse sample to the current phase of the process."""
+        mouse = self._to_mouse_input(sample.x, sample.y)
+        if self._start_point is None:
+            self._start_point = mouse
+        elif self._is_past_deadzone:
+            self._set_value(mouse)
+        elif abs(self._start_point - mouse) > self._slider.deadzone:
+            self._is_past_deadzone = True
+            self._update_interpreter(mouse)
+            self._set_value(mouse)
+
+    def _set_value(self, mouse: MouseInput) -> None:
+        """Request setting value from `SliderValues` for mouse position."""
+        clipped_value = self._interpreter.interpret(mouse)
         to_set = self._to_cycle.at(clipped_value)
-        self._slider.controller.set_value(to_set)
+        self._writer.request(to_set)
 
-    def _update_interpreter(self) -> None:
-        """Store a new interpreter with current mouse and current value."""
+    def _update_interpreter(self, mouse_origin: MouseInput) -> None:
+        """Store a new interpreter with given mouse and current value."""
         self._interpreter = MouseInterpreter(
             min=self._to_cycle.min,
             max=self._to_cycle.max,
-            mouse_origin=self.read_mouse(),
+            mouse_origin=mouse_origin,
             start_value=self._get_current_interpreted_value(),
             pixels_in_unit=self._slider.pixels_in_unit,
         )
@@ -114,20 +110,11 @@ class SliderHandler(Generic[T]):
         controller_value = self._slider.controller.get_value()
         return self._to_cycle.index(controller_value)
 
-    def _pick_mouse_getter(self) -> MouseGetter:
-        """
-        Refresh a mouse fetching method.
-
-        This can't be done in plugin initialization phase, as the
-        qwindow is not created at that point.
-
-        Doing it once on every process start guarantees correct work
-        even when the cursor object gets deleted by C++.
-        """
-        cursor = Krita.get_cursor()
+    def _to_mouse_input(self, x: int, y: int) -> MouseInput:
+        """Extract the tracked axis from the cursor position."""
         if self._is_horizontal:
-            return lambda: MouseInput(cursor.x())
-        return lambda: MouseInput(-cursor.y())
+            return MouseInput(x)
+        return MouseInput(-y)
 
     @staticmethod
     def _create_slider_values(slider: Slider[T]) -> SliderValues[T]:
@@ -3,6 +3,7 @@
 
 from typing import Any, Generic, TypeVar
 from abc import ABC, abstractmethod
+from bisect import bisect_left
 
 from data_components import Range
 from .new_types import Interpreted
@@ -74,13 +75,24 @@ class ListSliderValues(SliderValues, Generic[Controlled]):
     controlled list. They represent the full range of values that allow
     to fetch values considering the round conversion.
 
-    Controlled values may change over time.
+    Controlled values may change over time. Lookup structures used by
+    `index()` are rebuilt only when `version` of the values changes.
+    Values without a version, like regular lists, are indexed once:
+    - hash index maps each value to its first position. When values
+      are not hashable, list search is used instead.
+    - sorted numeric values allow to snap a non present value to the
+      closest bigger one with bisection.
     """
 
     def __init__(self, values: list[Controlled]) -> None:
         self._values = values
         self.min = Interpreted(-0.49)
 
+        self._indexed_version: int | None = None
+        self._is_indexed = False
+        self._positions: dict[Controlled, int] | None = None
+        self._sorted_numbers: list[Any] = []
+
     @property
     def max(self) -> Interpreted:
         """Calculate max as last float, which rounded, returns last element."""
@@ -98,9 +110,44 @@ class ListSliderValues(SliderValues, Generic[Controlled]):
 
     def index(self, value: Controlled) -> Interpreted:
         """Return index of list element directly from it."""
-        if value not in self._values:
+        self._refresh_lookup()
+        position = self._find(value)
+        if position is None:
             value = self._handle_non_present_element(value)
-        return Interpreted(self._values.index(value))
+            position = self._find(value)
+        return Interpreted(position)
+
+    def _refresh_lookup(self) -> None:
+        """Rebuild lookup structures when version of values changed."""
+        version = getattr(self._values, "version", None)
+        if self._is_indexed and version == self._indexed_version:
+            return
+        self._indexed_version = version
+        self._is_indexed = True
+
+        try:
+            positions: dict[Controlled, int] = {}
+            for position, element in enumerate(self._values):
+                positions.setdefault(element, position)
+            self._positions = positions
+        except TypeError:
+            self._positions = None
+
+        self._sorted_numbers = sorted(
+            element for element in self._values
+            if isinstance(element, (int, float)))
+
+    def _find(self, value: Controlled) -> int | None:
+        """Return first position of value in the list or None if absent."""
+        if self._positions is not None:
+            try:
+                return self._positions.get(value)
+            except TypeError:
+                return None
+        try:
+            return self._values.index(value)
+        except ValueError:
+            return None
 
     def _handle_non_present_element(self, value: Controlled) -> Controlled:
         """
@@ -109,12 +156,10 @@ class ListSliderValues(SliderValues, Generic[Controlled]):
         If the handled list elements are not sortable, return first element.
         For sortable elements, snap given value to closest element in a list.
         """
-        if not isinstance(value, (int, float)):
+        if not isinstance(value, (int, float)) or not self._sorted_numbers:
             return self._values[0]
 
-        sorted_values: list[Any] = sorted(self._values)
-        for list_element in sorted_values:
-            if list_element >= value:
-                return list_element
-
-        return sorted_values[-1]
+        position = bisect_left(self._sorted_numbers, value)
+        if position == len(self._sorted_numbers):
+            return self._sorted_numbers[-1]
+        return self._sorted_numbers[position]
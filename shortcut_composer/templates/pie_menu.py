@@ -1,7 +1,7 @@
 # SPDX-FileCopyrightText: © 2022-2024 Wojciech Trybus <wojtryb@gmail.com>
 # SPDX-License-Identifier: GPL-3.0-or-later
 
-from typing import TypeVar, Generic
+from typing import Iterator, TypeVar, Generic
 from functools import cached_property
 
 from PyQt5.QtCore import QPoint
@@ -10,11 +10,13 @@ from PyQt5.QtGui import QColor
 from api_krita import Krita
 from api_krita.pyqt import RoundButton
 from data_components import PieDeadzoneStrategy
+from input_adapter import Latency
 from core_components import Controller, Instruction
 from .pie_menu_utils.pie_config_impl import dispatch_pie_config
 from .pie_menu_utils.pie_settings_impl import dispatch_pie_settings
 from .pie_menu_utils import (
     PieStyleHolder,
+    PieLabelCache,
     PieActuator,
     PieSettings,
     PieEditMode,
@@ -104,6 +106,7 @@ class PieMenu(RawInstructions, Generic[T]):
         self._config.ORDER.register_callback(self._reset_labels)
 
         self._labels: list[PieLabel] = []
+        self._label_cache = PieLabelCache(self._controller)
         self._edit_mode = PieEditMode(self)
         self._style_holder = PieStyleHolder(pie_config=self._config)
         self._actuator = PieActuator(
@@ -118,7 +121,8 @@ class PieMenu(RawInstructions, Generic[T]):
             style_holder=self._style_holder,
             labels=self._labels,
             edit_mode=self._edit_mode,
-            config=self._config)
+            config=self._config,
+            action_name=self.name)
 
     @cached_property
     def pie_settings(self) -> PieSettings:
@@ -168,6 +172,22 @@ class PieMenu(RawInstructions, Generic[T]):
         accept_button.hide()
         return accept_button
 
+    def warm_up(self) -> Iterator[None]:
+        """
+        Create labels and widgets, leaving the settings for last.
+
+        Config is only red, as warming up should not change it.
+        """
+        self._create_labels()
+        yield
+        self.pie_widget.order_handler.reset(notify=False)
+        yield
+        self.pie_manager
+        self.settings_button
+        self.accept_button
+        yield
+        self.pie_settings
+
     def on_key_press(self) -> None:
         """Handle the event of user pressing the action key."""
         super().on_key_press()
@@ -176,24 +196,40 @@ class PieMenu(RawInstructions, Generic[T]):
             return
 
         self._controller.refresh()
+        Latency.mark("refresh")
         self._reset_labels()
+        Latency.mark("labels")
 
         self._move_accept_button_to_center()
         self.settings_button.move(QPoint(
             self.pie_widget.width()-self.settings_button.width(),
             self.pie_widget.height()-self.settings_button.height()))
+        Latency.mark("buttons")
 
         self.pie_widget.order_handler.reset()  # HACK: should be automatic
+        self.pie_widget.order_handler.show_page_of(
+            self._actuator.selected_label)
+        Latency.mark("layout")
 
         self._actuator.mark_selected_widget(
             self.pie_widget.order_handler.widget_holder)
 
         self.pie_manager.start()
+        Latency.mark("show")
 
     INVALID_VALUES: 'set[T]' = set()
 
     def _reset_labels(self) -> None:
-        """Replace list values with newly created labels."""
+        """Replace list values with newly created labels. Refresh order."""
+        if self._create_labels():
+            self._config.refresh_order()
+
+    def _create_labels(self) -> bool:
+        """
+        Replace list values with newly created labels.
+
+        Return whether the labels changed.
+        """
         values = self._config.values()
 
         # Workaround of krita tags sometimes returning invalid presets
@@ -204,17 +240,17 @@ class PieMenu(RawInstructions, Generic[T]):
         # Method is expensive, and should not be performed when values
         # did not in fact change.
         if filtered_values == current_values:
-            return
+            return False
 
         self._labels.clear()
+        self._label_cache.retain(values)
         for value in values:
-            label = PieLabel.from_value(value, self._controller)
+            label = self._label_cache.get(value)
             if label is not None:
                 self._labels.append(label)
             else:
                 self.INVALID_VALUES.add(value)
-
-        self._config.refresh_order()
+        return True
 
     def on_every_key_release(self) -> None:
         """
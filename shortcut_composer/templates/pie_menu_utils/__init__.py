@@ -4,6 +4,7 @@
 """Components used by PieMenu action."""
 
 from .pie_style_holder import PieStyleHolder
+from .pie_label_cache import PieLabelCache
 from .pie_edit_mode import PieEditMode
 from .pie_settings import PieSettings
 from .pie_actuator import PieActuator
@@ -15,6 +16,7 @@ from .pie_label import PieLabel
 
 __all__ = [
     "PieStyleHolder",
+    "PieLabelCache",
     "PieEditMode",
     "PieSettings",
     "PieActuator",
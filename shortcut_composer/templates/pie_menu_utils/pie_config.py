@@ -114,9 +114,14 @@ class PieConfig(FieldGroup, Generic[T], ABC):
         self,
         field_name: str,
         default: U,
-        parser_type: type | None = None
+        parser_type: type | None = None,
+        compact: bool = False,
     ) -> FieldWithEditableDefault[U, DualField[U]]:
         """Return field which can switch save location and default value."""
         return FieldWithEditableDefault(
-            DualField(self, self.SAVE_LOCAL, field_name, default, parser_type),
-            self.field(f"{field_name} default", default, parser_type))
+            DualField(
+                self, self.SAVE_LOCAL, field_name,
+                default, parser_type, compact),
+            self.field(
+                f"{field_name} default", default, parser_type,
+                compact=compact))
@@ -62,8 +62,10 @@ class NonPresetPieConfig(PieConfig[T], Generic[T]):
         self.ORDER.default = []
 
     def reset_to_default(self) -> None:
-        self.ORDER.reset_default()
-        self.refresh_order()
+        """Replace current list of values in pie with the default list."""
+        with self.transaction():
+            self.ORDER.reset_default()
+            self.refresh_order()
 
     def is_order_default(self) -> bool:
         """Return whether order is the same as default one."""
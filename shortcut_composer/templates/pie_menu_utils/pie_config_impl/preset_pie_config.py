@@ -51,7 +51,8 @@ class PresetPieConfig(PieConfig[str]):
         self.ORDER = self._create_editable_dual_field(
             field_name="Values",
             default=[],
-            parser_type=str)
+            parser_type=str,
+            compact=True)
 
     @property
     def allow_value_edit(self) -> bool:
@@ -68,35 +69,39 @@ class PresetPieConfig(PieConfig[str]):
         """When in tag mode, remember the tag order. Then write normally."""
         if self.TAG_MODE.read():
             group = "ShortcutComposer: Tag order"
-            field = Field(group, self.TAG_NAME.read(), [], str)
+            field = Field(group, self.TAG_NAME.read(), [], str, compact=True)
             field.write(values)
 
         self.ORDER.write(values)
 
     def refresh_order(self) -> None:
         """Refresh the values in case the active document changed."""
-        self.TAG_MODE.field.refresh()
-        self.TAG_NAME.field.refresh()
-        self.ORDER.write(self.values())
+        with self.transaction():
+            self.TAG_MODE.field.refresh()
+            self.TAG_NAME.field.refresh()
+            self.ORDER.write(self.values())
 
     def set_current_as_default(self) -> None:
         """Set current pie values as a new default list of values."""
-        self.TAG_MODE.default = self.TAG_MODE.read()
-        self.TAG_NAME.default = self.TAG_NAME.read()
-        self.ORDER.default = self.ORDER.read()
+        with self.transaction():
+            self.TAG_MODE.default = self.TAG_MODE.read()
+            self.TAG_NAME.default = self.TAG_NAME.read()
+            self.ORDER.default = self.ORDER.read()
 
     def reset_the_default(self) -> None:
         """Set empty pie as a new default list of values."""
-        self.TAG_MODE.default = False
-        self.TAG_NAME.default = ""
-        self.ORDER.default = []
+        with self.transaction():
+            self.TAG_MODE.default = False
+            self.TAG_NAME.default = ""
+            self.ORDER.default = []
 
     def reset_to_default(self) -> None:
         """Replace current list of values in pie with the default list."""
-        self.TAG_MODE.reset_default()
-        self.TAG_NAME.reset_default()
-        self.ORDER.reset_default()
-        self.refresh_order()
+        with self.transaction():
+            self.TAG_MODE.reset_default()
+            self.TAG_NAME.reset_default()
+            self.ORDER.reset_default()
+            self.refresh_order()
 
     def is_order_default(self) -> bool:
         """Return whether order is the same as default one."""
@@ -0,0 +1,93 @@
+# SPDX-FileCopyrightText: © 2022-2024 Wojciech Trybus <wojtryb@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from typing import Generic, TypeVar
+from collections import OrderedDict
+from weakref import WeakSet
+
+from core_components import Controller
+from .pie_label import PieLabel
+
+T = TypeVar("T")
+
+
+class PieLabelCache(Generic[T]):
+    """
+    Stores labels created by a controller, so that they can be reused.
+
+    Creating a label can be expensive, as controller may need to fetch
+    an image or icon of the value. Labels are stored under their value,
+    and when there is more of them than `size_limit`, the least
+    recently used ones are dropped.
+
+    Stored labels are never handed out. Each call to `get()` returns a
+    fresh copy, so that position and animation state are never shared
+    between slots of the pie, even when a value repeats.
+
+    Use `retain()` to drop labels of values which are no longer used,
+    so that their display value is fetched again when they return.
+
+    Values for which the controller can't create a label are not
+    stored. Values which can't be hashed are not stored either.
+
+    Labels depend on the theme, so all the caches need to be cleared
+    with `clear_all()` when it changes.
+    """
+
+    _instances: 'WeakSet[PieLabelCache]' = WeakSet()
+
+    def __init__(self, controller: Controller[T], size_limit: int = 256):
+        self._controller = controller
+        self._size_limit = size_limit
+        self._labels: OrderedDict[T, PieLabel[T]] = OrderedDict()
+        self._instances.add(self)
+
+    def get(self, value: T) -> PieLabel[T] | None:
+        """Return label of the value, creating it when not stored."""
+        try:
+            label = self._labels[value]
+        except KeyError:
+            pass
+        except TypeError:
+            return PieLabel.from_value(value, self._controller)
+        else:
+            self._labels.move_to_end(value)
+            return self._copy(label)
+
+        label = PieLabel.from_value(value, self._controller)
+        if label is None:
+            return None
+
+        self._labels[value] = label
+        if len(self._labels) > self._size_limit:
+            self._labels.popitem(last=False)
+        return self._copy(label)
+
+    def retain(self, values: 'list[T]') -> None:
+        """Drop stored labels of values not present in passed list."""
+        used: 'set[T]' = set()
+        for value in values:
+            try:
+                used.add(value)
+            except TypeError:
+                pass
+        for value in [v for v in self._labels if v not in used]:
+            del self._labels[value]
+
+    @staticmethod
+    def _copy(label: PieLabel[T]) -> PieLabel[T]:
+        """Return new label sharing only the display data of passed one."""
+        return PieLabel(
+            value=label.value,
+            display_value=label.display_value,
+            pretty_name=label.pretty_name)
+
+    def clear(self) -> None:
+        """Drop all stored labels."""
+        self._labels.clear()
+
+    @classmethod
+    def clear_all(cls) -> None:
+        """Drop labels stored in all existing caches."""
+        for cache in list(cls._instances):
+            cache.clear()
@@ -3,8 +3,12 @@
 
 from PyQt5.QtGui import QCursor
 
-from api_krita.pyqt import Timer
-from composer_utils import CirclePoints, Config
+from api_krita.pyqt import (
+    FrameClock,
+    FramePhase,
+    MouseMoveFilter,
+    MotionSample)
+from composer_utils import AnimationClock, CirclePoints
 from .pie_label import PieLabel
 from .pie_widget import PieWidget
 
@@ -14,11 +18,14 @@ class PieManager:
     Handles the passed PieWidget by tracking a mouse to find active label.
 
     Displays the widget between start() and stop() calls.
+
+    Active label is calculated when the widget gets shown, and later
+    only in frames in which the cursor moved.
     """
 
     def __init__(self, pie_widget: PieWidget) -> None:
         self._pie_widget = pie_widget
-        self._timer = Timer(self._handle_cursor, Config.get_sleep_time())
+        self._move_filter = MouseMoveFilter(self._handle_cursor)
         self._animator = LabelAnimator(pie_widget)
 
     def start(self) -> None:
@@ -26,7 +33,7 @@ class PieManager:
         self._pie_widget.move_center(QCursor().pos())
         self._pie_widget.show()
 
-        self._timer.start()
+        self._move_filter.start()
 
         # Make sure the pie widget is not draggable. It could have been
         # broken by pie settings reloading the widgets.
@@ -35,13 +42,13 @@ class PieManager:
     def stop(self, hide: bool = True) -> None:
         """Hide the widget and stop the mouse tracking loop."""
         self._pie_widget.active_label = None
-        self._timer.stop()
+        self._move_filter.stop()
         for label in self._pie_widget.order_handler:
             label.activation_progress.reset()
         if hide:
             self._pie_widget.hide()
 
-    def _handle_cursor(self) -> None:
+    def _handle_cursor(self, sample: MotionSample) -> None:
         """Calculate zone of the cursor and mark which child is active."""
         # NOTE: The widget can get hidden outside of stop() when key is
         # released during the drag&drop operation or when user clicked
@@ -55,7 +62,7 @@ class PieManager:
         if not self._pie_widget.order_handler:
             return
 
-        cursor = QCursor().pos()
+        cursor = sample.to_point()
         circle = CirclePoints(self._pie_widget.center_global, 0)
         if circle.distance(cursor) < self._pie_widget.deadzone:
             return self._set_active_label(None)
@@ -76,26 +83,38 @@ class LabelAnimator:
     Controls the animation of background under pie labels.
 
     Handles the whole widget at once, to prevent unnecessary repaints.
+    Only the areas of labels which changed their progress get repainted.
     """
 
     def __init__(self, pie_widget: PieWidget) -> None:
         self._pie_widget = pie_widget
-        self._timer = Timer(self._update, Config.get_sleep_time())
+        self._clock = AnimationClock()
+        self._is_running = False
 
     def start(self) -> None:
         """Start animating. The animation will stop automatically."""
-        self._timer.start()
+        if self._is_running:
+            return
+        self._is_running = True
+        self._clock.restart()
+        FrameClock.subscribe(self._update, FramePhase.UPDATE)
 
     def _update(self) -> None:
         """Move all labels to next animation state. End animation if needed."""
-        for label in self._pie_widget.order_handler:
+        elapsed = self._clock.tick()
+        changed: list[PieLabel] = []
+        for label in self._pie_widget.order_handler.visible_labels:
+            previous = label.activation_progress.value
             if self._pie_widget.active_label == label:
-                label.activation_progress.up()
+                label.activation_progress.up(elapsed)
             else:
-                label.activation_progress.down()
+                label.activation_progress.down(elapsed)
+            if label.activation_progress.value != previous:
+                changed.append(label)
 
-        self._pie_widget.repaint()
-        for label in self._pie_widget.order_handler:
+        self._pie_widget.update_active_pies(changed)
+        for label in self._pie_widget.order_handler.visible_labels:
             if label.activation_progress.value not in (0, 1):
                 return
-        self._timer.stop()
+        self._is_running = False
+        FrameClock.unsubscribe(self._update)
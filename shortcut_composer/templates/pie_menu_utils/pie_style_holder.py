@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 import math
+from typing import Any, Callable, TypeVar
 
 from PyQt5.QtGui import QColor
 
@@ -11,31 +12,55 @@ from composer_utils.label import LabelWidgetStyle
 from .pie_config import PieConfig
 from .pie_style import PieStyle
 
+T = TypeVar("T")
+
 
 class PieStyleHolder:
-    """Creates and gives access to style objects based on passed config."""
+    """
+    Creates and gives access to style objects based on passed config.
+
+    Values calculated from the config are remembered until generation
+    of the pie config, or the global config changes.
+    """
 
     def __init__(self, pie_config: PieConfig) -> None:
         self._pie_config = pie_config
         self._base_size = Krita.screen_size/2560
+        self._cache: dict[Callable[[], Any], Any] = {}
+        self._cache_generation: tuple[int, int] | None = None
 
         self.label_style = LabelWidgetStyle(
-            icon_radius_callback=self._icon_radius,
-            border_thickness_callback=self._border_thickness,
-            active_color_callback=self._active_color,
-            background_color_callback=self._background_color)
+            icon_radius_callback=self._memoized(self._icon_radius),
+            border_thickness_callback=self._memoized(self._border_thickness),
+            active_color_callback=self._memoized(self._active_color),
+            background_color_callback=self._memoized(self._background_color))
         self.unscaled_label_style = LabelWidgetStyle(
-            icon_radius_callback=self._unscaled_icon_radius,
-            border_thickness_callback=self._border_thickness,
-            active_color_callback=self._active_color,
-            background_color_callback=self._background_color)
+            icon_radius_callback=self._memoized(self._unscaled_icon_radius),
+            border_thickness_callback=self._memoized(self._border_thickness),
+            active_color_callback=self._memoized(self._active_color),
+            background_color_callback=self._memoized(self._background_color))
         self.pie_style = PieStyle(
             unscaled_label_style=self.unscaled_label_style,
-            pie_radius_callback=self._pie_radius,
-            deadzone_radius_callback=self._deadzone_radius,
+            pie_radius_callback=self._memoized(self._pie_radius),
+            deadzone_radius_callback=self._memoized(self._deadzone_radius),
             settings_button_radius_callback=self._settings_button_radius,
-            accept_button_radius_callback=self._accept_button_radius,
-            background_opacity_callback=self._pie_config.PIE_OPACITY.read)
+            accept_button_radius_callback=self._memoized(
+                self._accept_button_radius),
+            background_opacity_callback=self._memoized(
+                self._pie_config.PIE_OPACITY.read))
+
+    def _memoized(self, callback: Callable[[], T]) -> Callable[[], T]:
+        """Wrap callback to recalculate its value only on config change."""
+        def memoized_callback() -> T:
+            generation = (self._pie_config.generation, Config.generation)
+            if generation != self._cache_generation:
+                self._cache.clear()
+                self._cache_generation = generation
+
+            if callback not in self._cache:
+                self._cache[callback] = callback()
+            return self._cache[callback]
+        return memoized_callback
 
     def _pie_radius(self) -> int:
         """Return pie radius based on configured value."""
@@ -56,8 +81,12 @@ class PieStyleHolder:
         if not elements:
             max_radius = 1
         else:
+            # Only a single page of labels is displayed at once
+            displayed = len(elements)
+            if page_size := Config.get_pie_page_size():
+                displayed = min(displayed, page_size)
             max_radius = round(
-                self.pie_style.pie_radius * math.pi / len(elements))
+                self.pie_style.pie_radius * math.pi / displayed)
 
         return min(self._unscaled_icon_radius(), max_radius)
 
@@ -8,11 +8,16 @@ from PyQt5.QtGui import (
     QDragEnterEvent,
     QDragLeaveEvent,
     QDragMoveEvent,
-    QPaintEvent)
+    QDropEvent,
+    QHideEvent,
+    QPaintEvent,
+    QRegion,
+    QWheelEvent)
 
 from api_krita.pyqt import Painter, AnimatedWidget, BaseWidget
 from composer_utils import CirclePoints, Config
 from composer_utils.label import LabelWidget
+from input_adapter import Latency
 from .pie_edit_mode import PieEditMode
 from .pie_label import PieLabel
 from .pie_style_holder import PieStyleHolder
@@ -33,6 +38,9 @@ class PieWidget(AnimatedWidget, BaseWidget, Generic[T]):
     By dragging children, user can change their order or remove them
     by moving them out of the widget. New children can be added by
     dragging them from other widgets.
+
+    When there are more values than fit on a page, the pages can be
+    switched with a mouse wheel.
     """
 
     def __init__(
@@ -41,6 +49,7 @@ class PieWidget(AnimatedWidget, BaseWidget, Generic[T]):
         labels: list[PieLabel[T]],
         edit_mode: PieEditMode,
         config: PieConfig,
+        action_name: str,
         parent=None
     ) -> None:
         AnimatedWidget.__init__(self, parent, Config.PIE_ANIMATION_TIME.read())
@@ -60,6 +69,7 @@ class PieWidget(AnimatedWidget, BaseWidget, Generic[T]):
 
         self._style_holder = style_holder
         self._labels = labels
+        self._action_name = action_name
         self._config = config
         self._edit_mode = edit_mode
 
@@ -96,10 +106,24 @@ class PieWidget(AnimatedWidget, BaseWidget, Generic[T]):
         """Return whether the pie widget is in edit mode."""
         return self._edit_mode.get()
 
+    def update_active_pies(self, labels: list[PieLabel]) -> None:
+        """Schedule repainting only the area under pies of given labels."""
+        region = QRegion()
+        labels_amount = len(self.order_handler.visible_labels)
+        for label in labels:
+            region += self._painter.active_pie_bounds(label, labels_amount)
+        if not region.isEmpty():
+            self.update(region)
+
     def paintEvent(self, event: QPaintEvent) -> None:
         """Paint the entire widget using the Painter wrapper."""
         with Painter(self, event) as qt_painter:
-            self._painter.paint(qt_painter, self._labels)
+            self._painter.paint(
+                painter=qt_painter,
+                labels=self.order_handler.visible_labels,
+                page=self.order_handler.page,
+                page_count=self.order_handler.page_count)
+        Latency.finish(self._action_name)
 
     def dragEnterEvent(self, e: QDragEnterEvent) -> None:
         """Allow dragging the widgets while in edit mode."""
@@ -141,8 +165,8 @@ class PieWidget(AnimatedWidget, BaseWidget, Generic[T]):
         angle = circle_points.angle_from_point(e.pos())
         _a = self.order_handler.widget_holder.on_angle(angle)
 
-        if label not in self.order_handler or not self._labels:
-            # Dragged with unknown label
+        if label not in self.order_handler.visible_labels:
+            # Dragged with unknown label, or label from other page
             index = self.order_handler.index(_a.label)
             return self.order_handler.insert(index, label)
 
@@ -155,12 +179,40 @@ class PieWidget(AnimatedWidget, BaseWidget, Generic[T]):
         self.order_handler.swap(_a.label, _b.label)
         self.repaint()
 
+    def wheelEvent(self, e: QWheelEvent) -> None:
+        """Switch the displayed page of labels."""
+        if self.order_handler.page_count <= 1:
+            return super().wheelEvent(e)
+
+        delta = e.angleDelta().y()
+        if not delta:
+            return super().wheelEvent(e)
+
+        step = -1 if delta > 0 else 1
+        for label in self.order_handler:
+            label.activation_progress.reset()
+        self.active_label = None
+        self.order_handler.set_page(self.order_handler.page + step)
+        self.update()
+        e.accept()
+
     def dragLeaveEvent(self, e: QDragLeaveEvent) -> None:
         """Remove the label when its widget is dragged out."""
         if self._last_widget is not None:
             self.order_handler.remove(self._last_widget.label)
+        self.order_handler.write_pending_changes()
         return super().dragLeaveEvent(e)
 
+    def dropEvent(self, e: QDropEvent) -> None:
+        """Save the new order of labels, once the drag is finished."""
+        self.order_handler.write_pending_changes()
+        return super().dropEvent(e)
+
+    def hideEvent(self, e: QHideEvent) -> None:
+        """Save the new order of labels, if the drag ended by hiding."""
+        self.order_handler.write_pending_changes()
+        return super().hideEvent(e)
+
     @property
     def _type(self) -> type | None:
         """Return type of values stored in labels. None if no labels."""
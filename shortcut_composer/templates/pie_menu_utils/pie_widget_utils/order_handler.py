@@ -1,11 +1,11 @@
 # SPDX-FileCopyrightText: © 2022-2024 Wojciech Trybus <wojtryb@gmail.com>
 # SPDX-License-Identifier: GPL-3.0-or-later
 
-from typing import Iterator
+from typing import Hashable, Iterator
 from functools import partial
 
 from api_krita.pyqt import BaseWidget
-from composer_utils import CirclePoints
+from composer_utils import CirclePoints, Config
 from composer_utils.label import LabelWidget
 from composer_utils.label.label_widget_impl import dispatch_label_widget
 from ..pie_label import PieLabel
@@ -21,6 +21,20 @@ class OrderHandler:
     Creates and controls the publicly available WidgetHolder with
     actual pie widgets. Is responsible for making sure that WidgetHolder
     state always reflect the internal state of this container.
+
+    Widgets are kept in a pool, and reused for labels of the same value
+    as long as the size of the labels does not change. Widgets of values
+    no longer present in the pie are hidden instead of being destroyed.
+
+    Operations performed during drag (append, insert, remove and swap)
+    only move the widgets which changed their place on the circle. The
+    new order is saved to config once, with `write_pending_changes()`
+    when the drag is finished or the pie gets hidden.
+
+    When paging is turned on, and there are more labels than fit on a
+    single page, only the labels of the current page are represented by
+    widgets. Widgets of other pages are created when the page gets
+    displayed. Pool keeps at most two pages of unused widgets.
     """
 
     def __init__(
@@ -38,6 +52,11 @@ class OrderHandler:
         self._config.register_callback(partial(self.reset, notify=False))
         self._owner = owner
         self._locked = False
+        self._is_write_pending = False
+        self._page = 0
+
+        self._pool: dict[Hashable, list[LabelWidget[PieLabel]]] = {}
+        self._pool_style: tuple[int, int] | None = None
 
         self.widget_holder = WidgetHolder()
         self.reset(notify=False)
@@ -46,19 +65,27 @@ class OrderHandler:
         """Append the new label to the holder."""
         if (self._config.allow_value_edit):
             self._labels.append(label)
-            self.reset()
+            self._update_layout()
 
     def insert(self, index: int, label: PieLabel) -> None:
-        """Insert the new label to the holder at given index."""
+        """
+        Insert the new label to the holder at given index.
+
+        Label already present on other page is moved to the index.
+        """
         if (self._config.allow_value_edit):
+            if label in self._labels:
+                if self._labels.index(label) < index:
+                    index -= 1
+                self._labels.remove(label)
             self._labels.insert(index, label)
-            self.reset()
+            self._update_layout()
 
     def remove(self, label: PieLabel) -> None:
         """Remove the label from the holder."""
         if (label in self._labels and self._config.allow_value_edit):
             self._labels.remove(label)
-            self.reset()
+            self._update_layout()
 
     def index(self, label: PieLabel) -> int:
         """Return the index at which the label is stored."""
@@ -84,11 +111,55 @@ class OrderHandler:
         widget_b = self.widget_holder.on_label(self._labels[idx_b])
 
         self.widget_holder.swap(widget_a, widget_b)
+        self._is_write_pending = True
+
+    def write_pending_changes(self) -> None:
+        """Save order of labels to config if it changed since last save."""
+        if not self._is_write_pending:
+            return
+        self._is_write_pending = False
 
         self._locked = True
         self._config.set_values([label.value for label in self._labels])
         self._locked = False
 
+    @property
+    def page(self) -> int:
+        """Return index of currently displayed page."""
+        return self._page
+
+    @property
+    def page_count(self) -> int:
+        """Return amount of pages needed to display all labels."""
+        return max(-(-len(self._labels) // self._page_size), 1)
+
+    @property
+    def visible_labels(self) -> list[PieLabel]:
+        """Return labels of the currently displayed page."""
+        page_size = self._page_size
+        start = self._page * page_size
+        return self._labels[start:start+page_size]
+
+    @property
+    def _page_size(self) -> int:
+        """Return amount of labels on a page. All of them without paging."""
+        return Config.get_pie_page_size() or max(len(self._labels), 1)
+
+    def set_page(self, page: int) -> None:
+        """Display page of given index, wrapping around the page count."""
+        page %= self.page_count
+        if page == self._page:
+            return
+        self._page = page
+        self._place_on_circle(self._take_from_pool(self.visible_labels))
+
+    def show_page_of(self, label: PieLabel | None) -> None:
+        """Display page with the label. First page if there is none."""
+        if label not in self._labels:
+            return self.set_page(0)
+        index = self._labels.index(label)
+        self.set_page(index // self._page_size)
+
     def __iter__(self) -> Iterator[PieLabel]:
         """Iterate over all labels in the holder."""
         return iter(self._labels)
@@ -105,35 +176,129 @@ class OrderHandler:
         """
         if self._locked:
             return
+        self._page = min(self._page, self.page_count-1)
         # Reset is not needed when labels did not change from last reset
         current_labels = [widget.label for widget in self.widget_holder]
         # HACK: Labels need to be reset after config was changed, even
         # when the values are still the same
-        if current_labels == self._labels and notify:
+        if current_labels == self.visible_labels and notify:
             return
 
-        self._locked = True
         if notify:
-            self._config.set_values([label.value for label in self._labels])
-        self._locked = False
+            self._is_write_pending = True
+            self.write_pending_changes()
+        self._place_on_circle(self._take_from_pool(self.visible_labels))
 
-        for child in self.widget_holder:
-            child.setParent(None)  # type: ignore
-        self.widget_holder.clear()
+    def _update_layout(self) -> None:
+        """Rearrange widgets after change of labels, postponing the save."""
+        self._is_write_pending = True
+        self._page = min(self._page, self.page_count-1)
+        self._move_on_circle(self._take_from_pool(self.visible_labels))
 
-        children_widgets: list[LabelWidget[PieLabel]] = []
-        for label in self._labels:
-            children_widgets.append(dispatch_label_widget(label)(
-                label, self._style_holder.label_style, self._owner))
+    def _move_on_circle(self, widgets: list[LabelWidget[PieLabel]]) -> None:
+        """
+        Place widgets evenly on the circle, moving only the displaced ones.
+
+        Widgets which are already held on their new angle keep their
+        entries in the WidgetHolder. Widgets no longer displayed are
+        removed from it.
+        """
+        held_angles = {
+            id(widget): angle for angle, widget in self.widget_holder.items()}
+        taken_ids = {id(widget) for widget in widgets}
+        for widget in list(self.widget_holder):
+            if id(widget) not in taken_ids:
+                self.widget_holder.remove(widget)
 
         circle_points = CirclePoints(
             center=self._owner.center,
             radius=self._style_holder.pie_style.pie_radius)
-        angles = circle_points.iterate_over_circle(len(self._labels))
-        for child, (angle, point) in zip(children_widgets, angles):
-            child.setParent(self._owner)
-            child.show()
+        angles = circle_points.iterate_over_circle(len(widgets))
+        displaced: list[LabelWidget[PieLabel]] = []
+        for child, (angle, point) in zip(widgets, angles):
             child.label.angle = angle
             child.label.center = point
+            if held_angles.get(id(child)) == angle:
+                continue
+            if id(child) in held_angles:
+                self.widget_holder.remove(child)
+            if child.parent() is not self._owner:
+                child.setParent(self._owner)
+            child.show()
             child.draggable = True
+            displaced.append(child)
+
+        # Added after all removals, as they may take angles of others
+        for child in displaced:
             self.widget_holder.add(child)
+
+    def _place_on_circle(self, widgets: list[LabelWidget[PieLabel]]) -> None:
+        """Place existing widgets evenly on the circle and show them."""
+        self.widget_holder.clear()
+
+        circle_points = CirclePoints(
+            center=self._owner.center,
+            radius=self._style_holder.pie_style.pie_radius)
+        angles = circle_points.iterate_over_circle(len(widgets))
+        for child, (angle, point) in zip(widgets, angles):
+            if child.parent() is not self._owner:
+                child.setParent(self._owner)
+            child.show()
+            child.draggable = True
+            child.label.angle = angle
+            child.label.center = point
+            self.widget_holder.add(child)
+
+    def _take_from_pool(
+        self,
+        labels: list[PieLabel]
+    ) -> list[LabelWidget[PieLabel]]:
+        """
+        Return widgets for the labels, creating only the missing ones.
+
+        Widgets from the pool which were not taken get hidden, or
+        destroyed when the pool grew above two pages. Whole pool is
+        dropped when the size of the labels changed.
+        """
+        label_style = self._style_holder.label_style
+        style = (label_style.icon_radius, label_style.border_thickness)
+        if style != self._pool_style:
+            for widgets in self._pool.values():
+                for widget in widgets:
+                    widget.setParent(None)  # type: ignore
+            self._pool.clear()
+            self._pool_style = style
+
+        taken: list[LabelWidget[PieLabel]] = []
+        taken_ids: set[int] = set()
+        for label in labels:
+            pooled = self._pool.setdefault(label.value, [])
+            free = [w for w in pooled if id(w) not in taken_ids]
+            if free:
+                widget = free[0]
+                if widget.label is not label:
+                    widget.set_label(label)
+                widget.forced = False
+                widget.enabled = True
+            else:
+                widget = dispatch_label_widget(label)(
+                    label, label_style, self._owner)
+                pooled.append(widget)
+            taken.append(widget)
+            taken_ids.add(id(widget))
+
+        pool_limit = 2 * self._page_size
+        pooled_amount = sum(len(widgets) for widgets in self._pool.values())
+        for value, widgets in list(self._pool.items()):
+            for widget in list(widgets):
+                if id(widget) in taken_ids:
+                    continue
+                if pooled_amount <= pool_limit:
+                    widget.hide()
+                    continue
+                widget.setParent(None)  # type: ignore
+                widgets.remove(widget)
+                pooled_amount -= 1
+            if not widgets:
+                del self._pool[value]
+        return taken
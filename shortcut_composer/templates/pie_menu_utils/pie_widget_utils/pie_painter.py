@@ -1,8 +1,8 @@
 # SPDX-FileCopyrightText: © 2022-2024 Wojciech Trybus <wojtryb@gmail.com>
 # SPDX-License-Identifier: GPL-3.0-or-later
 
-from PyQt5.QtCore import QPoint
-from PyQt5.QtGui import QColor
+from PyQt5.QtCore import QPoint, QRect, QRectF, Qt
+from PyQt5.QtGui import QColor, QPixmap, QPainterPath
 
 from api_krita.pyqt import Painter
 from ..pie_style import PieStyle
@@ -10,53 +10,138 @@ from ..pie_label import PieLabel
 
 
 class PiePainter:
-    """Uses provided painter and parts of widget information to paint it."""
+    """
+    Uses provided painter and parts of widget information to paint it.
+
+    Layers which do not depend on animation (deadzone indicator and base
+    wheel) are painted once to a pixmap, and reused until the style or
+    the device pixel ratio changes.
+    """
 
     def __init__(self, style: PieStyle) -> None:
         self._style = style
-
-    def paint(self, painter: Painter, labels: list[PieLabel]) -> None:
+        self._static_layers: QPixmap | None = None
+        self._static_layers_key: tuple | None = None
+
+    def paint(
+        self,
+        painter: Painter,
+        labels: list[PieLabel],
+        page: int = 0,
+        page_count: int = 1,
+    ) -> None:
         """Paint the widget which created the passed painter."""
         self._painter = painter
         self._labels = labels
 
-        self._paint_deadzone_indicator()
-        self._paint_base_wheel()
+        self._paint_static_layers()
         self._paint_active_pie()
+        if page_count > 1:
+            self._paint_page_indicator(page, page_count)
+
+    def active_pie_bounds(self, label: PieLabel, labels_amount: int) -> QRect:
+        """
+        Return rectangle which the active pie of label can cover.
+
+        Takes into account the biggest size the pie reaches during the
+        animation, so that the rectangle does not change with it.
+        """
+        span = 360//labels_amount
+        angle = -label.angle + 90
+        outer_radius = (
+            self._style.pie_radius
+            + round(0.15 * self._style.area_thickness)
+            + self._style.border_thickness)
+        inner_radius = self._style.pie_radius - self._style.area_thickness
+
+        outer_rectangle = self._square(outer_radius)
+        inner_rectangle = self._square(inner_radius)
+        path = QPainterPath()
+        path.arcMoveTo(outer_rectangle, angle-span//2)
+        path.arcTo(outer_rectangle, angle-span//2, span)
+        path.arcTo(inner_rectangle, angle-span//2+span, -span)
+
+        # Margin covers the antialiasing and rounding of painted arcs
+        return path.boundingRect().toAlignedRect().adjusted(-2, -2, 2, 2)
+
+    def _square(self, radius: float) -> QRectF:
+        """Return a square bounding circle of radius at widget center."""
+        return QRectF(
+            self._center.x()-radius,
+            self._center.y()-radius,
+            radius*2,
+            radius*2)
 
     @property
     def _center(self) -> QPoint:
         """Return point with center widget's point in its coordinates."""
         return QPoint(self._style.widget_radius, self._style.widget_radius)
 
-    def _paint_deadzone_indicator(self) -> None:
+    def _paint_static_layers(self) -> None:
+        """Paint layers from pixmap, painting it first when outdated."""
+        ratio = self._painter.device_pixel_ratio
+        key = self._get_static_layers_key(ratio)
+        if self._static_layers is None or key != self._static_layers_key:
+            self._static_layers = self._create_static_layers(ratio)
+            self._static_layers_key = key
+
+        self._painter.paint_pixmap(self._center, self._static_layers)
+
+    def _get_static_layers_key(self, ratio: float) -> tuple:
+        """Return all values which affect the static layers."""
+        return (
+            ratio,
+            self._style.widget_radius,
+            self._style.pie_radius,
+            self._style.deadzone_radius,
+            self._style.area_thickness,
+            self._style.border_thickness,
+            self._style.inner_edge_radius,
+            self._style.decorator_thickness,
+            self._style.background_color.rgba(),
+            self._style.border_color.rgba(),
+            self._style.background_decorator_color.rgba())
+
+    def _create_static_layers(self, ratio: float) -> QPixmap:
+        """Paint layers which do not depend on animation to a pixmap."""
+        size = round(2 * self._style.widget_radius * ratio)
+        pixmap = QPixmap(size, size)
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+
+        with Painter(pixmap) as painter:
+            self._paint_deadzone_indicator(painter)
+            self._paint_base_wheel(painter)
+        return pixmap
+
+    def _paint_deadzone_indicator(self, painter: Painter) -> None:
         """Paint the circle representing deadzone, when its valid."""
         if self._style.deadzone_radius == float("inf"):
             return
 
-        self._painter.paint_wheel(
+        painter.paint_wheel(
             center=self._center,
             outer_radius=self._style.deadzone_radius,
             color=QColor(128, 255, 128, 120),
             thickness=1)
 
-        self._painter.paint_wheel(
+        painter.paint_wheel(
             center=self._center,
             outer_radius=self._style.deadzone_radius-1,
             color=QColor(255, 128, 128, 120),
             thickness=1)
 
-    def _paint_base_wheel(self) -> None:
+    def _paint_base_wheel(self, painter: Painter) -> None:
         """Paint a base circle."""
         # NOTE: Windows10 does not treat the transparent center as part
         # of the widget, so a low opacity circle allows to trick it.
-        self._painter.paint_wheel(
+        painter.paint_wheel(
             center=self._center,
             outer_radius=self._style.widget_radius,
             color=QColor(128, 128, 128, 1))
 
         # base wheel
-        self._painter.paint_wheel(
+        painter.paint_wheel(
             center=self._center,
             outer_radius=self._style.pie_radius,
             color=self._style.background_color,
@@ -64,14 +149,14 @@ class PiePainter:
             + self._style.border_thickness//2)
 
         # base wheel border
-        self._painter.paint_wheel(
+        painter.paint_wheel(
             center=self._center,
             outer_radius=self._style.inner_edge_radius,
             color=self._style.border_color,
             thickness=self._style.border_thickness)
 
         # base wheel decorator
-        self._painter.paint_wheel(
+        painter.paint_wheel(
             center=self._center,
             outer_radius=(
                 self._style.inner_edge_radius
@@ -117,6 +202,23 @@ class PiePainter:
                 color=self._style.active_color_dark,
                 thickness=self._style.border_thickness)
 
+    def _paint_page_indicator(self, page: int, page_count: int) -> None:
+        """Paint a row of dots below the center, marking current page."""
+        radius = max(self._style.border_thickness, 2)
+        spacing = radius*3
+        first_x = self._center.x() - spacing*(page_count-1)//2
+        y = self._center.y() + round(self._style.inner_edge_radius*0.75)
+
+        for index in range(page_count):
+            if index == page:
+                color = self._style.active_color
+            else:
+                color = self._style.border_color
+            self._painter.paint_wheel(
+                center=QPoint(first_x + index*spacing, y),
+                outer_radius=radius,
+                color=color)
+
     def _pick_pie_color(self, label: PieLabel) -> QColor:
         """Pick color of pie based on widget mode and animation progress."""
         return self._overlay_colors(
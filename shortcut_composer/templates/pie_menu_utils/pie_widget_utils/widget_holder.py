@@ -1,6 +1,7 @@
 # SPDX-FileCopyrightText: © 2022-2024 Wojciech Trybus <wojtryb@gmail.com>
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+from bisect import bisect
 from typing import Iterator
 
 from composer_utils.label import LabelWidget
@@ -10,16 +11,28 @@ PieLabelWidget = LabelWidget[PieLabel]
 
 
 class WidgetHolder:
-    """Holds LabelWidgets in relation to their angles on PieWidget."""
+    """
+    Holds LabelWidgets in relation to their angles on PieWidget.
+
+    Sorted angles are remembered until the set of angles changes, so
+    that finding the widget closest to an angle is a binary search.
+    """
 
     def __init__(self) -> None:
         self._widgets: dict[int, PieLabelWidget] = {}
+        self._sorted_angles: list[int] | None = None
 
     def add(self, widget: PieLabelWidget) -> None:
         """Add a new LabelWidget[Label] to the holder."""
         self._widgets[widget.label.angle] = widget
+        self._sorted_angles = None
         widget.move_center(widget.label.center)
 
+    def remove(self, widget: PieLabelWidget) -> None:
+        """Remove the LabelWidget[Label] from the holder."""
+        del self._widgets[self.angle(widget)]
+        self._sorted_angles = None
+
     def swap(self, w_a: PieLabelWidget, w_b: PieLabelWidget) -> None:
         """Swap position of two widgets."""
         a_angle = w_a.label.angle
@@ -34,13 +47,18 @@ class WidgetHolder:
 
     def on_angle(self, angle: float) -> PieLabelWidget:
         """Return LabelWidget which is the closest to given `angle`."""
-        def angle_difference(label_angle: float) -> float:
-            """Return the smallest difference between two angles."""
-            raw_difference = label_angle - angle
-            return abs((raw_difference + 180) % 360 - 180)
+        if self._sorted_angles is None:
+            self._sorted_angles = sorted(self._widgets)
+
+        # Closest angle is one of two neighbours, wrapping around 360
+        angles = self._sorted_angles
+        index = bisect(angles, angle % 360)
+        before = angles[index-1]
+        after = angles[index % len(angles)]
 
-        closest = min(self.angles(), key=angle_difference)
-        return self._widgets[closest]
+        if _angle_difference(after, angle) < _angle_difference(before, angle):
+            return self._widgets[after]
+        return self._widgets[before]
 
     def on_label(self, label: PieLabel) -> PieLabelWidget:
         """Return widget wrapping the label of the same value as given."""
@@ -59,6 +77,11 @@ class WidgetHolder:
     def clear(self) -> None:
         """Remove all widgets from the holder."""
         self._widgets = {}
+        self._sorted_angles = None
+
+    def items(self) -> Iterator[tuple[int, PieLabelWidget]]:
+        """Iterate over pairs of angles and LabelWidgets held on them."""
+        return iter(list(self._widgets.items()))
 
     def angles(self) -> Iterator[int]:
         """Iterate over all angles at which LabelWidgets are."""
@@ -77,3 +100,8 @@ class WidgetHolder:
         """Clear the forced colors of all held widgets. Helper method."""
         for widget in self._widgets.values():
             widget.forced = False
+
+
+def _angle_difference(angle_a: float, angle_b: float) -> float:
+    """Return the smallest difference between two angles."""
+    return abs((angle_a - angle_b + 180) % 360 - 180)
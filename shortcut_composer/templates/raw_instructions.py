@@ -50,6 +50,7 @@ class RawInstructions(ComplexActionInterface):
 
     def on_key_press(self) -> None:
         """Run instructions meant for key press event."""
+        Config.remember_used_action(self.name)
         self._instructions.on_key_press()
 
     def on_short_key_release(self) -> None:
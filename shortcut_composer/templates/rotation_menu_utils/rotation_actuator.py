@@ -3,9 +3,9 @@
 
 from PyQt5.QtGui import QCursor
 
-from api_krita.pyqt import Timer
-from composer_utils import Config
+from api_krita.pyqt import FrameClock, FramePhase
 from config_system import Field
+from core_components import WriteScheduler
 from data_components import RotationDeadzoneStrategy
 from shortcut_composer.core_components.controller_base import Controller
 from .rotation_widget import RotationWidget
@@ -19,6 +19,8 @@ class RotationActuator:
 
     Actuator tracks selected strategy using `strategy_field` passed on
     initialization. It can be changed in runtime.
+
+    Values are written to the controller at most once per frame.
     """
 
     def __init__(
@@ -31,6 +33,7 @@ class RotationActuator:
         self._rotation_widget = rotation_widget
         self._controller = controller
         self._config = config
+        self._writer = WriteScheduler(controller)
 
         def update_strategy() -> None:
             self._deadzone_strategy = strategy_field.read()
@@ -38,26 +41,26 @@ class RotationActuator:
         strategy_field.register_callback(update_strategy)
         update_strategy()
 
-        self._timer = Timer(self._update, Config.get_sleep_time())
-
     def start(self) -> None:
         """Start loop of contiguous value setting."""
         self._center_global = QCursor().pos()
         self._starting_value = self._reverse_modifier(
             self._controller.get_value())
 
-        self._timer.start()
+        self._writer.start()
+        FrameClock.subscribe(self._update, FramePhase.UPDATE)
 
     def stop(self) -> None:
         """Stop the loop of contiguous value setting."""
-        self._timer.stop()
+        FrameClock.unsubscribe(self._update)
+        self._writer.stop()
 
     def _update(self) -> None:
         """Set the angle considering deadzone strategy and value modifier."""
         if self._rotation_widget.state.selected_zone != Zone.DEADZONE:
             value = self._rotation_widget.state.selected_angle
             modified = self._modifier(value)
-            self._controller.set_value(modified)
+            self._writer.request(modified)
             return
 
         match self._deadzone_strategy:
@@ -66,9 +69,9 @@ class RotationActuator:
             case RotationDeadzoneStrategy.DISCARD_CHANGE:
                 value = self._starting_value
                 modified = self._modifier(value)
-                self._controller.set_value(modified)
+                self._writer.request(modified)
             case RotationDeadzoneStrategy.SET_TO_ZERO:
-                self._controller.set_value(0)
+                self._writer.request(0)
             case _:
                 raise RuntimeError(
                     f"{self._deadzone_strategy} not recognized.")
@@ -3,8 +3,8 @@
 
 from PyQt5.QtGui import QCursor
 
-from api_krita.pyqt import Timer
-from composer_utils import CirclePoints, Config
+from api_krita.pyqt import FrameClock, FramePhase
+from composer_utils import AnimationClock, CirclePoints
 from .rotation_widget import RotationWidget
 from .rotation_config import RotationConfig
 from .rotation_style import RotationStyle
@@ -17,6 +17,11 @@ class RotationManager:
 
     Displays the widget and tracks a mouse between start() and stop() calls.
     Contiguously updates widget state, updates animations and paints it.
+    Reads the cursor in the input phase of a frame, and repaints the
+    widget in the paint phase.
+
+    Config and style are read once on start(), and remembered until
+    the stop() call.
     """
 
     def __init__(
@@ -28,23 +33,32 @@ class RotationManager:
         self._rotation_widget = rotation_widget
         self._config = config
         self._style = style
-
-        self._timer = Timer(self._handle_cursor, Config.get_sleep_time())
+        self._clock = AnimationClock()
 
     def start(self) -> None:
         """Show widget under the mouse and start the mouse tracking loop."""
+        self._style.snapshot()
+        self._is_inverse = self._config.INVERSE_ZONES.read()
+        self._deadzone_radius = self._style.deadzone_radius
+        self._inner_zone_radius = self._style.inner_zone_radius
+        self._intervallic_pie_span = self._style.intervallic_pie_span
+
         if not self._config.IS_WIDGET_HIDDEN.read():
             self._rotation_widget.move_center(QCursor().pos())
             self._rotation_widget.show()
 
         self._center_global = QCursor().pos()
-        self._rotation_widget.state.reset()
+        self._rotation_widget.state.reset(self._intervallic_pie_span)
+        self._clock.restart()
 
-        self._timer.start()
+        FrameClock.subscribe(self._handle_cursor, FramePhase.INPUT)
+        FrameClock.subscribe(self._update_widget, FramePhase.PAINT)
 
     def stop(self, hide: bool = True) -> None:
         """Hide the widget and stop the mouse tracking loop."""
-        self._timer.stop()
+        FrameClock.unsubscribe(self._handle_cursor)
+        FrameClock.unsubscribe(self._update_widget)
+        self._style.drop_snapshot()
         if hide:
             self._rotation_widget.hide()
 
@@ -53,10 +67,11 @@ class RotationManager:
         cursor = QCursor().pos()
         circle = CirclePoints(self._center_global, 0)
 
-        is_inverse = self._config.INVERSE_ZONES.read()
-        if circle.distance(cursor) < self._style.deadzone_radius:
+        is_inverse = self._is_inverse
+        distance = circle.distance(cursor)
+        if distance < self._deadzone_radius:
             zone = Zone.DEADZONE
-        elif circle.distance(cursor) < self._style.inner_zone_radius:
+        elif distance < self._inner_zone_radius:
             zone = Zone.PRECISE_ZONE if is_inverse else Zone.INTERVALLIC_ZONE
         else:
             zone = Zone.INTERVALLIC_ZONE if is_inverse else Zone.PRECISE_ZONE
@@ -66,10 +81,12 @@ class RotationManager:
         if zone == Zone.INTERVALLIC_ZONE:
             angle = self._snap_degree(
                 value=angle,
-                step_size=self._style.intervallic_pie_span)
+                step_size=self._intervallic_pie_span)
         self._rotation_widget.state.selected_angle = angle
 
-        self._rotation_widget.state.tick_animations()
+    def _update_widget(self) -> None:
+        """Move animations of the widget to next state and repaint it."""
+        self._rotation_widget.state.tick_animations(self._clock.tick())
         self._rotation_widget.repaint()
 
     @staticmethod
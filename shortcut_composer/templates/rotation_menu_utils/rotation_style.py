@@ -1,7 +1,7 @@
 # SPDX-FileCopyrightText: © 2022-2024 Wojciech Trybus <wojtryb@gmail.com>
 # SPDX-License-Identifier: GPL-3.0-or-later
 
-from typing import Callable
+from typing import Any, Callable
 
 from PyQt5.QtGui import QColor
 
@@ -14,6 +14,10 @@ class RotationStyle:
 
     Callbacks passed in init determine base values. Rest of the values
     is calculated using those base values.
+
+    Values of callbacks can be remembered with `snapshot()`, so that
+    they are not read again on each frame while the widget is used.
+    Snapshot is used until `drop_snapshot()` is called.
     """
 
     def __init__(
@@ -32,16 +36,39 @@ class RotationStyle:
         self._outline_opacity_callback = outline_opacity_callback
 
         self._base_size = Krita.screen_size/2560
+        self._snapshot: dict[Callable[[], Any], Any] | None = None
+
+    def snapshot(self) -> None:
+        """Remember current values of all callbacks."""
+        self._snapshot = {
+            callback: callback() for callback in (
+                self._deadzone_scale_callback,
+                self._inner_zone_scale_callback,
+                self._divisions_callback,
+                self._active_color_callback,
+                self._outline_opacity_callback)}
+
+    def drop_snapshot(self) -> None:
+        """Read values from callbacks again."""
+        self._snapshot = None
+
+    def _read(self, callback: Callable[[], Any]) -> Any:
+        """Return value of callback, from snapshot if it was taken."""
+        if self._snapshot is None:
+            return callback()
+        return self._snapshot[callback]
 
     @property
     def deadzone_radius(self) -> int:
         """Radius of the deadzone in the center."""
-        return round(100 * self._deadzone_scale_callback() * self._base_size)
+        return round(
+            100 * self._read(self._deadzone_scale_callback) * self._base_size)
 
     @property
     def inner_zone_span(self) -> int:
         """Length of the zone after the deadzone, excluding it."""
-        return round(75 * self._inner_zone_scale_callback() * self._base_size)
+        return round(
+            75 * self._read(self._inner_zone_scale_callback) * self._base_size)
 
     @property
     def inner_zone_radius(self) -> int:
@@ -71,7 +98,7 @@ class RotationStyle:
     @property
     def active_color(self) -> QColor:
         """Color of the selection pie."""
-        return self._active_color_callback()
+        return self._read(self._active_color_callback)
 
     @property
     def active_color_dark(self) -> QColor:
@@ -97,7 +124,7 @@ class RotationStyle:
     @property
     def intervallic_pie_span(self) -> int:
         """Span of the pie in the intervallic zone."""
-        return 360//self._divisions_callback()
+        return 360//self._read(self._divisions_callback)
 
     @property
     def precise_pie_span(self) -> int:
@@ -107,5 +134,5 @@ class RotationStyle:
     @property
     def outline_opacity(self) -> int:
         """Opacity [0-255] of the outline for deadzone, and inner zone."""
-        opacity = round(self._outline_opacity_callback() * 255/100)
+        opacity = round(self._read(self._outline_opacity_callback) * 255/100)
         return sorted([0, opacity, 255])[1]
@@ -8,6 +8,7 @@ from PyQt5.QtGui import QPaintEvent
 
 from api_krita.pyqt import Painter, AnimatedWidget, BaseWidget
 from composer_utils import Config
+from input_adapter import Latency
 from .rotation_widget_utils import RotationPainter, WidgetState
 from .rotation_config import RotationConfig
 from .rotation_style import RotationStyle
@@ -22,10 +23,12 @@ class RotationWidget(AnimatedWidget, BaseWidget, Generic[T]):
         self,
         config: RotationConfig,
         style: RotationStyle,
+        action_name: str,
         parent=None
     ) -> None:
         self._config = config
         self._style = style
+        self._action_name = action_name
 
         self.state = WidgetState()
 
@@ -52,6 +55,7 @@ class RotationWidget(AnimatedWidget, BaseWidget, Generic[T]):
             self._rotation_painter.paint(
                 painter=painter,
                 state=self.state)
+        Latency.finish(self._action_name)
 
     def _resize(self) -> None:
         """Change the widget window to value required by its configuration."""
@@ -1,25 +1,52 @@
 # SPDX-FileCopyrightText: © 2022-2024 Wojciech Trybus <wojtryb@gmail.com>
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+from collections import OrderedDict
+
 from PyQt5.QtCore import QPoint
-from PyQt5.QtGui import QColor
+from PyQt5.QtGui import QColor, QPainterPath
 
 from api_krita.pyqt import Painter
 from ..rotation_style import RotationStyle
 from .rotation_widget_state import Zone, WidgetState
 
+PathKey = tuple[int, int, int]
+"""Angle, span and thickness change of a decorated pie."""
+
 
 class RotationPainter:
-    """Uses provided painter and parts of widget information to paint it."""
+    """
+    Uses provided painter and parts of widget information to paint it.
+
+    Paths of the selection pies are created once and reused until the
+    geometry of the style changes. Pies differ in angle, span and
+    animation state, so only the recently used ones are remembered.
+    """
+
+    MAX_CACHED_PIES = 64
+    """Amount of decorated pies which paths are remembered."""
 
     def __init__(self, style: RotationStyle) -> None:
         self._style = style
+        self._paths: OrderedDict[PathKey, list[QPainterPath]] = OrderedDict()
+        self._geometry: tuple[int, ...] | None = None
 
     def paint(self, painter: Painter, state: WidgetState) -> None:
         """Paint the widget which created the passed painter."""
         self._painter = painter
         self._state = state
 
+        geometry = (
+            self._style.widget_radius,
+            self._style.deadzone_radius,
+            self._style.inner_zone_radius,
+            self._style.transparent_border,
+            self._style.decorator_thickness,
+            self._style.border_thickness)
+        if geometry != self._geometry:
+            self._paths.clear()
+            self._geometry = geometry
+
         self._paint_deadzone_indicator()
         self._paint_free_zone_indicator()
         self._paint_selection()
@@ -65,13 +92,11 @@ class RotationPainter:
 
     def _paint_selection(self) -> None:
         """Paint pies representing selected value."""
-        for angle, progress in self._state.animations_in_progress.items():
-            if progress.value == 0:
-                continue
+        for angle, value in self._state.animations_in_progress():
             self._paint_decorated_pie(
                 angle=angle,
                 span=self._style.intervallic_pie_span,
-                animation_value=progress.value)
+                animation_value=value)
 
         if self._state.selected_zone == Zone.PRECISE_ZONE:
             self._paint_decorated_pie(
@@ -86,62 +111,74 @@ class RotationPainter:
         animation_value: float,
     ) -> None:
         """Paint a pie with decorator and border."""
-        thickness = self._style.inner_zone_radius-self._style.deadzone_radius+2
-        # +2 allows the indicator to cover the deadzone circle
-
         thickness_change = round(
             (1-animation_value) * self._style.transparent_border)
 
-        # two outlines on both sides
-        self._painter.paint_pie(
-            center=self._center,
-            outer_radius=self._style.inner_zone_radius+thickness_change-2,
-            angle=angle,
-            span=span+4,  # Add 2 degrees on each side
-            color=self._scale_opacity(
-                QColor(255, 128, 128, self._style.outline_opacity),
-                animation_value),
-            thickness=thickness+thickness_change-2)
-
-        self._painter.paint_pie(
-            center=self._center,
-            outer_radius=self._style.inner_zone_radius+thickness_change,
-            angle=angle,
-            span=span+2,  # Add 1 degree on each side
-            color=self._scale_opacity(
-                QColor(128, 255, 128, self._style.outline_opacity),
-                animation_value),
-            thickness=thickness+thickness_change)
-
-        # indicator base
-        self._painter.paint_pie(
-            center=self._center,
-            outer_radius=self._style.inner_zone_radius+thickness_change,
-            angle=angle,
-            span=span,
-            color=self._scale_opacity(
-                self._style.active_color, animation_value),
-            thickness=thickness+thickness_change+2)
-
-        # indicator decorator
-        self._painter.paint_pie(
-            center=self._center,
-            outer_radius=self._style.inner_zone_radius+thickness_change,
-            angle=angle,
-            span=span,
-            color=self._scale_opacity(
-                self._style.active_color_dark, animation_value),
-            thickness=self._style.decorator_thickness)
-
-        # indicator top border
-        self._painter.paint_pie(
-            center=self._center,
-            outer_radius=self._style.inner_zone_radius+thickness_change+1,
-            angle=angle,
-            span=span,
-            color=self._scale_opacity(
-                self._style.border_color, animation_value),
-            thickness=self._style.border_thickness)
+        key = (angle, span, thickness_change)
+        if key in self._paths:
+            self._paths.move_to_end(key)
+        else:
+            self._paths[key] = self._create_decorated_pie_paths(*key)
+            if len(self._paths) > self.MAX_CACHED_PIES:
+                self._paths.popitem(last=False)
+
+        colors = (
+            QColor(255, 128, 128, self._style.outline_opacity),
+            QColor(128, 255, 128, self._style.outline_opacity),
+            self._style.active_color,
+            self._style.active_color_dark,
+            self._style.border_color)
+        for path, color in zip(self._paths[key], colors):
+            self._painter.paint_path(
+                path=path,
+                color=self._scale_opacity(color, animation_value))
+
+    def _create_decorated_pie_paths(
+        self,
+        angle: int,
+        span: int,
+        thickness_change: int,
+    ) -> list[QPainterPath]:
+        """Return paths of pie parts, in order in which they are painted."""
+        thickness = self._style.inner_zone_radius-self._style.deadzone_radius+2
+        # +2 allows the indicator to cover the deadzone circle
+        outer_radius = self._style.inner_zone_radius+thickness_change
+
+        return [
+            # two outlines on both sides
+            Painter.pie_path(
+                center=self._center,
+                outer_radius=outer_radius-2,
+                angle=angle,
+                span=span+4,  # Add 2 degrees on each side
+                thickness=thickness+thickness_change-2),
+            Painter.pie_path(
+                center=self._center,
+                outer_radius=outer_radius,
+                angle=angle,
+                span=span+2,  # Add 1 degree on each side
+                thickness=thickness+thickness_change),
+            # indicator base
+            Painter.pie_path(
+                center=self._center,
+                outer_radius=outer_radius,
+                angle=angle,
+                span=span,
+                thickness=thickness+thickness_change+2),
+            # indicator decorator
+            Painter.pie_path(
+                center=self._center,
+                outer_radius=outer_radius,
+                angle=angle,
+                span=span,
+                thickness=self._style.decorator_thickness),
+            # indicator top border
+            Painter.pie_path(
+                center=self._center,
+                outer_radius=outer_radius+1,
+                angle=angle,
+                span=span,
+                thickness=self._style.border_thickness)]
 
     @staticmethod
     def _scale_opacity(color: QColor, scale: float) -> QColor:
@@ -2,10 +2,10 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 from enum import Enum
+from typing import Iterator
 from dataclasses import dataclass
-from collections import defaultdict
 
-from composer_utils import AnimationProgress
+from composer_utils import AnimationProgressArray
 
 
 class Zone(Enum):
@@ -21,27 +21,45 @@ class Zone(Enum):
 
 @dataclass
 class WidgetState:
-    """Represents current state of the widget."""
+    """
+    Represents current state of the widget.
+
+    Animations of intervallic pies are stored in an array with an
+    element for each pie, indexed by pie angle divided by pie span.
+    """
 
     selected_angle: int = 0
     selected_zone: Zone = Zone.DEADZONE
+    pie_span: int = 1
 
     def __post_init__(self) -> None:
-        self.animations_in_progress = defaultdict(lambda: AnimationProgress())
+        self._animations = AnimationProgressArray(self._pie_amount)
         """State of animations for each intervallic pie."""
 
-    def reset(self) -> None:
-        """Reset the state to starting value."""
+    def reset(self, pie_span: int) -> None:
+        """Reset the state to starting value, using given pie span."""
         self.selected_angle = 0
         self.selected_zone = Zone.DEADZONE
-        self.animations_in_progress.clear()
+        self.pie_span = pie_span
+        if len(self._animations) != self._pie_amount:
+            self._animations = AnimationProgressArray(self._pie_amount)
+        else:
+            self._animations.reset()
 
-    def tick_animations(self) -> None:
-        """Update animations of intervallic pies."""
-        current_animation = self.animations_in_progress[self.selected_angle]
+    def tick_animations(self, elapsed: float) -> None:
+        """Update animations of intervallic pies by elapsed seconds."""
         if self.selected_zone == Zone.INTERVALLIC_ZONE:
-            current_animation.up()
+            raised = self.selected_angle // self.pie_span
+        else:
+            raised = None
+        self._animations.tick(raised, elapsed)
+
+    def animations_in_progress(self) -> Iterator[tuple[int, float]]:
+        """Iterate over angles and values of running pie animations."""
+        for index, value in self._animations.running():
+            yield index*self.pie_span, value
 
-        for animation in self.animations_in_progress.values():
-            if animation != current_animation:
-                animation.down()
+    @property
+    def _pie_amount(self) -> int:
+        """Return amount of intervallic pies, including the partial one."""
+        return -(-360 // self.pie_span)
@@ -1,6 +1,7 @@
 # SPDX-FileCopyrightText: © 2022-2024 Wojciech Trybus <wojtryb@gmail.com>
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+from typing import Iterator
 from functools import cached_property
 
 from PyQt5.QtWidgets import QWidget
@@ -11,6 +12,7 @@ from api_krita import Krita
 from api_krita.pyqt import RoundButton
 from core_components import Controller, Instruction
 from data_components import RotationDeadzoneStrategy
+from input_adapter import Latency
 from .raw_instructions import RawInstructions
 from .rotation_menu_utils import (
     RotationSettings,
@@ -109,10 +111,13 @@ class RotationSelector(RawInstructions):
             divisions_callback=self._config.DIVISIONS.read,
             active_color_callback=self._config.ACTIVE_COLOR.read,
             outline_opacity_callback=self._config.OUTLINE_OPACITY.read)
+        # Must be registered before the widget uses style on config change
+        self._config.register_callback(self._style.drop_snapshot)
 
         self._rotation_widget = RotationWidget(
             config=self._config,
-            style=self._style)
+            style=self._style,
+            action_name=self.name)
 
         self._rotation_manager = RotationManager(
             rotation_widget=self._rotation_widget,
@@ -157,12 +162,21 @@ class RotationSelector(RawInstructions):
         """Create a settings widget which configures the menu."""
         return RotationSettings(config=self._config)
 
+    def warm_up(self) -> Iterator[None]:
+        """Create buttons and leave the settings for last."""
+        self._settings_button
+        self._global_settings_button
+        yield
+        self._rotation_settings
+
     def on_key_press(self) -> None:
         """Handle the event of user pressing the action key."""
         super().on_key_press()
         self._controller.refresh()
+        Latency.mark("refresh")
         self._rotation_manager.start()
         self._rotation_actuator.start()
+        Latency.mark("show")
 
         self._settings_button.move(QPoint(
             self._rotation_widget.width()-self._settings_button.width(),
@@ -174,6 +188,8 @@ class RotationSelector(RawInstructions):
             mdiArea = Krita.get_active_mdi_area()
             self._global_settings_button.move(
                 mdiArea.mapToGlobal(mdiArea.pos()))
+            # Hidden widget never gets painted
+            Latency.finish(self.name, "settings button")
 
     def on_every_key_release(self) -> None:
         """Handle the key release event."""